@@ -1,17 +1,16 @@
 """Main ArTui application."""
 
+import asyncio
+import functools
 import os
-import re
 import sys
 import webbrowser
 import platform
 import subprocess
-from typing import Optional, List, Dict, Any
-
-import arxiv
-import requests
-import pyperclip
-from pyinspirehep import Client
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Mapping, Set, Tuple
 
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
@@ -20,7 +19,9 @@ from textual.widgets import (
     Checkbox, ListView, ListItem
 )
 from textual.coordinate import Coordinate
+from textual.css.query import NoMatches
 from textual import work, events
+from textual.worker import get_current_worker
 
 from .database import ArticleDatabase
 from .config import ConfigManager
@@ -32,7 +33,9 @@ from .ui.screens import (
     FirstRunPopupScreen,
 )
 from .ui.widgets import ArticleTableWidget
-from .ui.utils import convert_db_results_to_articles, debug_log
+from .ui.utils import (
+    convert_db_results_to_articles, copy_to_clipboard, debug_log, get_http_session, sanitize_widget_id,
+)
 
 
 # Legacy file paths for migration
@@ -65,6 +68,29 @@ class ArxivReaderApp(App):
     ]
     BINDINGS = DEFAULT_BINDINGS
 
+    # Minimum pause between the end of one manual refresh and the next
+    REFRESH_COOLDOWN_SECONDS = 0.5
+
+    # Count refresh requests arriving within this window are coalesced
+    COUNTS_REFRESH_DELAY_SECONDS = 0.2
+
+    # Articles highlighted in the results table are marked viewed in batches
+    # written at most this long after the first highlight
+    VIEWED_FLUSH_DELAY_SECONDS = 1.0
+
+    # Inspire-HEP lookups are answered from the database for this long
+    CITATION_CACHE_TTL_SECONDS = 24 * 60 * 60
+    ARTICLE_TAGS_CACHE_SIZE = 4096  # Most recently shown articles whose tags are kept
+
+    # ListViews in the left panel; at most one of them holds a selection
+    LEFT_PANEL_LISTS = (
+        "feed_articles_list",
+        "filters_list",
+        "categories_list",
+        "library_articles_list",
+        "tags_list",
+    )
+
     def __init__(self, config_path: Optional[str] = None, db_path: Optional[str] = None, 
                  custom_user_dir: Optional[str] = None, *args, **kwargs):
         # Initialize user directories first
@@ -93,9 +119,31 @@ class ArxivReaderApp(App):
         self.last_refresh_time = None
         self.advanced_search_params = None
         self.is_refreshing = False
+        self._last_refresh_finished = 0.0
+        self._counts_refresh_handle = None
+        self._header_counts: Tuple[int, int] = (0, 0)  # Feed and library article counts
+        self._pending_viewed: Set[str] = set()  # Viewed article IDs not yet in the database
+        self._viewed_flush_handle = None
+        self._tag_names: Set[str] = set()  # Tags currently listed in the left panel
+        self._all_tags: Optional[List[Dict]] = None  # get_all_tags() result until the next tag edit
+        self._article_tags_cache: "OrderedDict[str, List[str]]" = OrderedDict()  # Article ID -> tag names, LRU order
         self.refresh_progress_text = ""
         self._refresh_spinner_frames = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
         self._refresh_spinner_index = 0
+        self._category_names_config = None
+        self._category_names_by_code: Dict[str, str] = {}
+        self._popup_options_config = None
+        self._popup_options: List[tuple] = []
+        self._selection_targets: Dict[tuple, Tuple[str, str]] = {}
+        self._menu_labels: Dict[str, Static] = {}  # Left-panel item id -> label widget
+        self._search_input: Optional[Input] = None
+        self._global_search_checkbox: Optional[Checkbox] = None
+        self._results_table: Optional[ArticleTableWidget] = None
+        self._abstract_view: Optional[Static] = None
+        self._results_title: Optional[Static] = None
+        self._header_status: Optional[Static] = None
+        self._list_views: Dict[str, ListView] = {}  # Left-panel ListView id -> widget
+        self._active_list_view: Optional[ListView] = None  # The only list with a selection
         
         # Set default theme
         self.dark = True
@@ -170,37 +218,38 @@ class ArxivReaderApp(App):
 
     def _create_left_panel(self):
         """Create the left panel widgets."""
-        # Get unread counts
-        unread_count = self.db.get_unread_count()
+        # Get all counts in one query
+        counts = self._get_left_panel_counts()
+        self._store_header_counts(counts["totals"])
+        unread_count = counts["totals"].get("unread", 0)
         unread_text = f"Unread ({unread_count})" if unread_count > 0 else "Unread"
         
-        saved_unread_count = self.db.get_unread_saved_count()
-        saved_text = f"Saved ({saved_unread_count})" if saved_unread_count > 0 else "Saved"
+        saved_count = counts["totals"].get("saved", 0)
+        saved_text = f"Saved ({saved_count})" if saved_count > 0 else "Saved"
         
         # Feed section
         yield Static("Feed", classes="section_title_header")
         with Vertical(id="feed_container", classes="section_container"):
             yield ListView(
-                ListItem(Static("All articles"), id="all_articles_filter"),
-                ListItem(Static(unread_text), id="unread_articles_filter"),
+                self._menu_item("all_articles_filter", "All articles"),
+                self._menu_item("unread_articles_filter", unread_text),
                 id="feed_articles_list",
             )
 
             # Filters subsection under Feed
             config = self.config_manager.get_config()
-            retention_days = config.get("feed_retention_days", 30)
             filters = config.get("filters", {})
             if filters:
                 with Vertical(id="filters_container"):
                     yield Static("Filters", classes="pane_title sub_title")
                     filter_items = []
-                    for name, filter_config in filters.items():
-                        unread_count = self.db.get_unread_count_by_filter(filter_config, retention_days)
+                    for name in filters:
+                        unread_count = counts["filters"].get(name, 0)
                         filter_text = f"{name} ({unread_count})" if unread_count > 0 else name
                         
-                        filter_items.append(
-                            ListItem(Static(filter_text), id=f"filter_{name.replace(' ', '_')}")
-                        )
+                        filter_item = self._menu_item(f"filter_{sanitize_widget_id(name)}", filter_text)
+                        filter_item.original_filter_name = name  # Store original name
+                        filter_items.append(filter_item)
                     yield ListView(*filter_items, id="filters_list")
 
             # Categories subsection under Feed
@@ -210,12 +259,12 @@ class ArxivReaderApp(App):
                     yield Static("Categories", classes="pane_title sub_title")
                     category_items = []
                     for name, code in categories.items():
-                        unread_count = self.db.get_unread_count_by_category(code, retention_days)
+                        unread_count = counts["categories"].get(code, 0)
                         category_text = f"{name} ({unread_count})" if unread_count > 0 else name
                         
                         # Sanitize category code for use as ID (dots are not allowed)
-                        sanitized_code = re.sub(r'[^a-zA-Z0-9_-]', '_', code)
-                        category_item = ListItem(Static(category_text), id=f"cat_{sanitized_code}")
+                        sanitized_code = sanitize_widget_id(code)
+                        category_item = self._menu_item(f"cat_{sanitized_code}", category_text)
                         category_item.original_category_code = code  # Store original code
                         category_items.append(category_item)
                     yield ListView(*category_items, id="categories_list")
@@ -224,12 +273,12 @@ class ArxivReaderApp(App):
         yield Static("Library", classes="section_title_header")
         with Vertical(id="library_container", classes="section_container"):
             # Get notes count for display
-            notes_unread_count = self.db.get_unread_count_with_notes()
-            notes_text = f"Notes ({notes_unread_count})" if notes_unread_count > 0 else "Notes"
+            notes_count = counts["totals"].get("notes", 0)
+            notes_text = f"Notes ({notes_count})" if notes_count > 0 else "Notes"
             
             yield ListView(
-                ListItem(Static(saved_text), id="saved_articles_filter"),
-                ListItem(Static(notes_text), id="notes_articles_filter"),
+                self._menu_item("saved_articles_filter", saved_text),
+                self._menu_item("notes_articles_filter", notes_text),
                 id="library_articles_list",
             )
 
@@ -237,42 +286,86 @@ class ArxivReaderApp(App):
 
             # Tags subsection under Library
             with Vertical(id="tags_container"):
-                all_tags = self.db.get_all_tags()
+                all_tags = self._get_all_tags()
+                self._tag_names = {tag['name'] for tag in all_tags}
                 if all_tags:
                     yield Static("Tags", classes="pane_title sub_title")
                     tag_items = []
                     for tag in all_tags:
-                        unread_count = self.db.get_unread_count_by_tag(tag['name'])
+                        unread_count = counts["tags"].get(tag['name'], 0)
                         tag_text = f"{tag['name']} ({unread_count})" if unread_count > 0 else tag['name']
-                        sanitized_tag_name = re.sub(r'[^a-zA-Z0-9_-]', '_', tag['name'])
+                        sanitized_tag_name = sanitize_widget_id(tag['name'])
                         
-                        tag_item = ListItem(Static(tag_text), id=f"tag_{sanitized_tag_name}")
+                        tag_item = self._menu_item(f"tag_{sanitized_tag_name}", tag_text)
                         tag_item.original_tag_name = tag['name']
                         tag_items.append(tag_item)
                     yield ListView(*tag_items, id="tags_list")
 
+    def _menu_item(self, item_id: str, text: str) -> ListItem:
+        """Create a left-panel ListItem and remember its label for count updates."""
+        label = Static(text)
+        self._menu_labels[item_id] = label
+        return ListItem(label, id=item_id)
+
+    def _set_menu_text(self, item_id: str, text: str) -> None:
+        """Update the label of a left-panel item, if it exists."""
+        label = self._menu_labels.get(item_id)
+        # Most refreshes leave most counts unchanged; skip the re-render and layout
+        if label is not None and label.content != text:
+            label.update(text)
+
+    def _get_list_view(self, list_view_id: str) -> Optional[ListView]:
+        """Return a left-panel ListView by id, re-querying only after it was remounted."""
+        list_view = self._list_views.get(list_view_id)
+        if list_view is None or not list_view.is_attached:
+            try:
+                list_view = self.query_one(f"#{list_view_id}", ListView)
+            except NoMatches:
+                return None
+            self._list_views[list_view_id] = list_view
+        return list_view
+
+    def _set_active_list_view(self, list_view: Optional[ListView]) -> None:
+        """Make ``list_view`` the only left-panel list with a selection (``None`` clears all)."""
+        # Reset every list, not just the previous one: keyboard highlights and
+        # remounted lists also leave an index behind without a selection
+        for list_view_id in self.LEFT_PANEL_LISTS:
+            other = self._get_list_view(list_view_id)
+            if other is not None and other is not list_view:
+                other.index = None
+        self._active_list_view = list_view
+
     def on_mount(self) -> None:
         """Call after the app is mounted."""
         if hasattr(self, "refresh_bindings"):
             self.refresh_bindings()
 
-        table = self.query_one("#results_table", ArticleTableWidget)
+        # These widgets are never remounted, so look them up once
+        self._search_input = self.query_one("#search_input", Input)
+        self._global_search_checkbox = self.query_one("#global_search_checkbox", Checkbox)
+        self._results_table = self.query_one("#results_table", ArticleTableWidget)
+        self._abstract_view = self.query_one("#abstract_content", Static)
+        self._results_title = self.query_one("#results_title", Static)
+        self._header_status = self.query_one("#header_status", Static)
+
+        table = self._results_table
 
         # Automatically select "Unread" as the default view
         self.current_selection = "unread_articles_filter"
         
         # Deselect all ListViews first
-        for list_view in self.query(ListView):
-            list_view.index = None
+        self._set_active_list_view(None)
         
         try:
-            self.query_one("#feed_articles_list", ListView).index = 1  # Select second item (Unread)
+            feed_list = self.query_one("#feed_articles_list", ListView)
+            feed_list.index = 1  # Select second item (Unread)
+            self._set_active_list_view(feed_list)
             self.load_articles()
         except Exception:
             pass  # List view or item not found
 
         # Set initial state of global search checkbox
-        global_search_checkbox = self.query_one("#global_search_checkbox", Checkbox)
+        global_search_checkbox = self._global_search_checkbox
         global_search_checkbox.value = self.global_search_enabled
 
         # Update header status on mount
@@ -283,7 +376,8 @@ class ArxivReaderApp(App):
             # On first run, hold off fetching until the user has edited their config
             self.call_after_refresh(self._show_first_run_popup)
         else:
-            self.manual_refresh_articles()
+            # Paint the cached articles first; fetching from arXiv can take a while
+            self.call_after_refresh(self.manual_refresh_articles)
 
     def _show_first_run_popup(self) -> None:
         """Push the first-run welcome screen."""
@@ -325,9 +419,7 @@ class ArxivReaderApp(App):
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle menu item selection from list views."""
         # Deselect items in other list views
-        for list_view in self.query(ListView):
-            if list_view is not event.list_view:
-                list_view.index = None
+        self._set_active_list_view(event.list_view)
 
 
 
@@ -341,6 +433,7 @@ class ArxivReaderApp(App):
             # Toggle off if the same item is selected again
             self.current_selection = None
             event.list_view.index = None
+            self._set_active_list_view(None)
             self.load_articles()
             return
         
@@ -351,16 +444,13 @@ class ArxivReaderApp(App):
             self.current_selection = new_selection
 
             # Clear search input and uncheck global search when selecting a category
-            search_input = self.query_one("#search_input", Input)
+            search_input = self._search_input
             search_input.value = ""
             self.current_query = ""
             
-            global_search_checkbox = self.query_one("#global_search_checkbox", Checkbox)
+            global_search_checkbox = self._global_search_checkbox
             global_search_checkbox.value = False
             self.global_search_enabled = False
-
-            # Refresh left panel counts when switching views
-            self.refresh_left_panel_counts()
             
             # Add notification to show what was selected
             if new_selection == "all_articles_filter":
@@ -399,6 +489,9 @@ class ArxivReaderApp(App):
     def _parse_selection_id(self, widget_id: str, item) -> Optional[str]:
         """Parse widget ID to determine selection."""
         if widget_id.startswith("filter_"):
+            # Use original filter name if stored, otherwise fall back to the sanitized ID
+            if hasattr(item, 'original_filter_name'):
+                return item.original_filter_name
             return widget_id[len("filter_"):].replace("_", " ")
         elif widget_id.startswith("cat_"):
             # Use original category code if stored, otherwise fall back to sanitized ID
@@ -419,14 +512,12 @@ class ArxivReaderApp(App):
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle search input submission."""
         self.current_query = event.value
-        self.refresh_left_panel_counts()
         self.load_articles()
 
     def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
         """Handle global search checkbox changes."""
         if event.checkbox.id == "global_search_checkbox":
             self.global_search_enabled = event.value
-            self.refresh_left_panel_counts()
             # If there's a current query, re-run the search with new mode
             if self.current_query:
                 self.load_articles()
@@ -438,10 +529,10 @@ class ArxivReaderApp(App):
 
     def load_articles(self) -> None:
         """Prepare for fetching articles and trigger the worker."""
-        table = self.query_one("#results_table", ArticleTableWidget)
-        abstract_view = self.query_one("#abstract_content", Static)
+        # The database must see viewed marks before the new view is queried
+        self._flush_viewed()
+        table = self._results_table
         table.clear()
-        abstract_view.update("No article selected")
 
         # Check if global search is enabled and we have a query
         if self.global_search_enabled and self.current_query:
@@ -469,7 +560,6 @@ class ArxivReaderApp(App):
         self.call_from_thread(self._show_refresh_loading_indicator)
         try:
             # Record refresh time
-            import time
             self.last_refresh_time = time.time()
 
             # Silently reload config from disk so any external edits are picked up
@@ -485,7 +575,7 @@ class ArxivReaderApp(App):
             
             # Reload the current view to show new articles
             self.call_from_thread(self.load_articles)
-            self.call_from_thread(self.refresh_left_panel_counts)
+            self.call_from_thread(self._schedule_counts_refresh)
             self.call_from_thread(self.update_header_status)
             
             self.call_from_thread(self.clear_notifications)
@@ -516,73 +606,67 @@ class ArxivReaderApp(App):
             self.call_from_thread(self._set_refresh_progress_text, "")
             self.call_from_thread(self._set_refreshing_state, False)
 
-    @work(exclusive=True, thread=True, group="results-load")
-    def fetch_articles_from_arxiv(self) -> None:
-        """Worker to fetch articles directly from arXiv API for global search."""
-        abstract_view = self.query_one("#abstract_content", Static)
+    @staticmethod
+    def _prepare_external_results(results: List[Any]) -> List[Any]:
+        """Give arXiv API results the same status and display attributes as database articles.
 
-        try:
-            # Use the fetcher to search arXiv
-            arxiv_results = self.fetcher.search_arxiv(self.current_query, max_results=100)
-            
-            # Add status information (not saved, not viewed since from global search)
-            self.search_results = []
-            for result in arxiv_results:
-                result.is_saved = False
-                result.is_viewed = False
-                self.search_results.append(result)
-                
-        except Exception as e:
-            self.call_from_thread(
-                abstract_view.update,
-                f"[bold red]Error fetching articles from arXiv:[/bold red]\n{e}",
-            )
-            self.search_results = []
+        The results are updated in place and the same list is returned.
+        """
+        for result in results:
+            result.is_saved = False
+            result.is_viewed = False
+            result.has_tags = False
+            result.has_note = False
+            result.notes_file_path = None
+            result.authors_str = ", ".join(author.name for author in result.authors)
+            result.categories_str = ", ".join(result.categories)
+            result.published_day = result.published.strftime("%Y-%m-%d")
+        return results
+
+    @work(exclusive=True, group="results-load")
+    async def fetch_articles_from_arxiv(self) -> None:
+        """Worker to fetch articles directly from arXiv API for global search."""
+        await self._run_arxiv_search(self.current_query, 100)
 
-        self.call_from_thread(self._populate_table)
-        self.call_from_thread(self.query_one("#results_table").focus)
-    
-    @work(exclusive=True, thread=True, group="results-load")
-    def fetch_articles_from_arxiv_advanced(self, search_params: Dict[str, Any]) -> None:
+    @work(exclusive=True, group="results-load")
+    async def fetch_articles_from_arxiv_advanced(self, search_params: Dict[str, Any]) -> None:
         """Worker to fetch articles from arXiv using advanced search parameters."""
-        abstract_view = self.query_one("#abstract_content", Static)
+        await self._run_arxiv_search(
+            search_params["query"],
+            search_params["max_results"],
+            search_params["sort_by"],
+        )
+
+    async def _run_arxiv_search(self, query: str, max_results: int, sort_by: str = "relevance") -> None:
+        """Search arXiv off the event loop and show the results.
 
+        The blocking request runs in a thread while the worker awaits it, so a
+        newer search cancels this one before its stale results are shown.
+        """
+        error_message = None
         try:
-            # Use the fetcher to search arXiv with advanced parameters
-            arxiv_results = self.fetcher.search_arxiv(
-                query=search_params["query"],
-                max_results=search_params["max_results"],
-                sort_by=search_params["sort_by"]
+            loop = asyncio.get_running_loop()
+            arxiv_results = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    self.fetcher.search_arxiv, query, max_results=max_results, sort_by=sort_by
+                ),
             )
             
             # Add status information (not saved, not viewed since from global search)
-            self.search_results = []
-            for result in arxiv_results:
-                result.is_saved = False
-                result.is_viewed = False
-                self.search_results.append(result)
+            self.search_results = self._prepare_external_results(arxiv_results)
                 
         except Exception as e:
-            self.call_from_thread(
-                abstract_view.update,
-                f"[bold red]Error fetching articles from arXiv:[/bold red]\n{e}",
-            )
+            error_message = f"[bold red]Error fetching articles from arXiv:[/bold red]\n{e}"
             self.search_results = []
 
-        # Clear the table before populating with new results
-        self.call_from_thread(self.query_one("#results_table").clear)
-        self.call_from_thread(self._populate_table)
-        self.call_from_thread(self.query_one("#results_table").focus)
+        self._finish_fetch(error_message)
     
     @work(exclusive=True, thread=True, group="results-load")
     def fetch_articles_by_references(self, inspire_ids: List[int]) -> None:
         """Worker to fetch articles by INSPIRE-HEP reference IDs."""
         from .ui.utils import get_arxiv_ids_from_inspire_ids
         
-        # Get table and abstract view references
-        table = self.query_one("#results_table", ArticleTableWidget)
-        abstract_view = self.query_one("#abstract_content", Static)
-
         try:
             # Convert INSPIRE IDs to arXiv IDs
             self.call_from_thread(
@@ -600,21 +684,14 @@ class ArxivReaderApp(App):
                     severity="warning",
                     timeout=5
                 )
-                self.call_from_thread(table.clear)
-                self.call_from_thread(self._populate_table)
-                self.call_from_thread(self.update_results_title)
-                self.call_from_thread(self.refresh_left_panel_counts)
+                self.call_from_thread(self._finish_fetch)
                 return
 
             # Fetch articles by arXiv IDs
             arxiv_results = self.fetcher.fetch_articles_by_ids(arxiv_ids)
 
             # Add status information (not saved, not viewed since from references)
-            self.search_results = []
-            for result in arxiv_results:
-                result.is_saved = False
-                result.is_viewed = False
-                self.search_results.append(result)
+            self.search_results = self._prepare_external_results(arxiv_results)
 
             # Set flag to indicate results are from references (similar to global search)
             self.current_results_from_global = True
@@ -628,30 +705,21 @@ class ArxivReaderApp(App):
             )
 
         except Exception as e:
-            self.call_from_thread(table.clear)
+            self.search_results = []
             self.call_from_thread(
-                abstract_view.update,
+                self._finish_fetch,
                 f"[bold red]Error fetching reference articles:[/bold red]\n{e}",
             )
-            self.search_results = []
             return
 
-        # Clear the loading indicator and populate with real results
-        self.call_from_thread(table.clear)
-        self.call_from_thread(self._populate_table)
-        self.call_from_thread(self.update_results_title)
-        self.call_from_thread(self.refresh_left_panel_counts)
-        self.call_from_thread(self.query_one("#results_table").focus)
+        # Replace the loading indicator with the real results
+        self.call_from_thread(self._finish_fetch)
     
     @work(exclusive=True, thread=True, group="results-load")
     def fetch_articles_by_citations(self, inspire_id: int) -> None:
         """Worker to fetch articles that cite the given INSPIRE-HEP record."""
         from .ui.utils import get_citing_articles_from_inspire_id
         
-        # Get table and abstract view references
-        table = self.query_one("#results_table", ArticleTableWidget)
-        abstract_view = self.query_one("#abstract_content", Static)
-
         try:
             # Get arXiv IDs of citing articles
             self.call_from_thread(
@@ -669,21 +737,14 @@ class ArxivReaderApp(App):
                     severity="warning",
                     timeout=5
                 )
-                self.call_from_thread(table.clear)
-                self.call_from_thread(self._populate_table)
-                self.call_from_thread(self.update_results_title)
-                self.call_from_thread(self.refresh_left_panel_counts)
+                self.call_from_thread(self._finish_fetch)
                 return
 
             # Fetch articles by arXiv IDs
             arxiv_results = self.fetcher.fetch_articles_by_ids(arxiv_ids)
 
             # Add status information (not saved, not viewed since from citations)
-            self.search_results = []
-            for result in arxiv_results:
-                result.is_saved = False
-                result.is_viewed = False
-                self.search_results.append(result)
+            self.search_results = self._prepare_external_results(arxiv_results)
 
             # Set flag to indicate results are from citations (similar to global search)
             self.current_results_from_global = True
@@ -697,60 +758,44 @@ class ArxivReaderApp(App):
             )
 
         except Exception as e:
-            self.call_from_thread(table.clear)
+            self.search_results = []
             self.call_from_thread(
-                abstract_view.update,
+                self._finish_fetch,
                 f"[bold red]Error fetching citing articles:[/bold red]\n{e}",
             )
-            self.search_results = []
             return
 
-        # Clear the loading indicator and populate with real results
-        self.call_from_thread(table.clear)
-        self.call_from_thread(self._populate_table)
-        self.call_from_thread(self.update_results_title)
-        self.call_from_thread(self.refresh_left_panel_counts)
-        self.call_from_thread(self.query_one("#results_table").focus)
+        # Replace the loading indicator with the real results
+        self.call_from_thread(self._finish_fetch)
     
     @work(exclusive=True, thread=True, group="results-load")
     def fetch_articles_from_db(self) -> None:
         """Worker to fetch and display articles from database."""
-        abstract_view = self.query_one("#abstract_content", Static)
-
+        error_message = None
         try:
             db_results = self._get_db_results()
-            self.search_results = convert_db_results_to_articles(db_results)
+            self.search_results = convert_db_results_to_articles(
+                db_results, self.db.get_article_summary
+            )
             
         except Exception as e:
-            self.call_from_thread(
-                abstract_view.update,
-                f"[bold red]Error fetching articles from database:[/bold red]\n{e}",
-            )
+            error_message = f"[bold red]Error fetching articles from database:[/bold red]\n{e}"
             self.search_results = []
 
-        self.call_from_thread(self._populate_table)
-        self.call_from_thread(self.query_one("#results_table").focus)
+        self.call_from_thread(self._finish_fetch, error_message)
 
-    def _get_db_results(self) -> List[Dict[str, Any]]:
+    def _get_db_results(self) -> List[Mapping[str, Any]]:
         """Get database results based on current selection and query."""
         config = self.config_manager.get_config()
         retention_days = config.get("feed_retention_days", 30)
         
         # Library selections (no feed retention applied)
         if self.current_selection == "saved_articles_filter":
-            if self.current_query:
-                saved_results = self.db.get_saved_articles()
-                return self._filter_results_by_query(saved_results)
-            else:
-                return self.db.get_saved_articles()
+            return self.db.get_saved_articles(self.current_query)
         
         # Feed selections (apply feed retention)
         elif self.current_selection == "unread_articles_filter":
-            if self.current_query:
-                unread_results = self.db.get_unread_articles()
-                return self._filter_results_by_query(unread_results)
-            else:
-                return self.db.get_unread_articles()
+            return self.db.get_unread_articles(self.current_query)
         
         elif self.current_selection == "all_articles_filter":
             if self.current_query:
@@ -763,11 +808,7 @@ class ArxivReaderApp(App):
                 return db_results
         
         elif self.current_selection == "notes_articles_filter":
-            if self.current_query:
-                notes_results = self.db.get_articles_with_notes()
-                return self._filter_results_by_query(notes_results)
-            else:
-                return self.db.get_articles_with_notes()
+            return self.db.get_articles_with_notes(self.current_query)
         
         elif self.current_query and not self.current_selection:
             return self.db.search_articles(self.current_query, retention_days)
@@ -777,25 +818,11 @@ class ArxivReaderApp(App):
         
         return []
 
-    def _filter_results_by_query(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Filter results by search query."""
-        search_lower = self.current_query.lower()
-        return [
-            result for result in results
-            if (search_lower in (result.get('title') or '').lower() or
-                search_lower in (result.get('summary') or '').lower() or
-                search_lower in (result.get('authors') or '').lower())
-        ]
-
-    def _handle_special_selections(self, config: Dict[str, Any], retention_days: int) -> List[Dict[str, Any]]:
+    def _handle_special_selections(self, config: Dict[str, Any], retention_days: int) -> List[Mapping[str, Any]]:
         """Handle special selections like tags, filters, and categories."""
         if self.current_selection.startswith("tag_"):
             tag_name = self.current_selection[4:]  # Remove "tag_" prefix
-            if self.current_query:
-                tagged_results = self.db.get_articles_by_tag(tag_name)
-                return self._filter_results_by_query(tagged_results)
-            else:
-                return self.db.get_articles_by_tag(tag_name)
+            return self.db.get_articles_by_tag(tag_name, self.current_query)
         
         elif self.current_selection in config.get("filters", {}):
             filter_details = config["filters"][self.current_selection]
@@ -812,51 +839,38 @@ class ArxivReaderApp(App):
                 combined_query = search_query or filter_query
                 return self.db.search_articles(combined_query, retention_days)
             elif filter_categories:
-                return self._get_articles_from_categories(filter_categories, retention_days)
+                return self.db.get_articles_by_categories(filter_categories, retention_days)
             else:
                 return []
 
         elif self.current_selection in config.get("categories", {}).values():
             if self.current_query:
-                category_results = self.db.get_articles_by_category(self.current_selection, retention_days)
-                return self._filter_results_by_query(category_results)
+                return self.db.search_articles_in_categories(self.current_query, [self.current_selection], retention_days)
             else:
                 self.call_from_thread(self.notify, f"Fetching feed articles for category: {self.current_selection} (retention: {retention_days} days)")
                 return self.db.get_articles_by_category(self.current_selection, retention_days)
         
         return []
 
-    def _get_articles_from_categories(self, filter_categories: List[str], retention_days: int) -> List[Dict[str, Any]]:
-        """Get articles from multiple categories and remove duplicates."""
-        all_results = []
-        for cat in filter_categories:
-            cat_results = self.db.get_articles_by_category(cat, retention_days)
-            all_results.extend(cat_results)
-        
-        # Remove duplicates and sort by published date
-        seen = set()
-        unique_results = []
-        for result in all_results:
-            if result['id'] not in seen:
-                seen.add(result['id'])
-                unique_results.append(result)
-        
-        return sorted(unique_results, key=lambda x: x['published_date'], reverse=True)
+    def _finish_fetch(self, error_message: Optional[str] = None) -> None:
+        """Show freshly fetched results in a single UI-thread hop."""
+        abstract_view = self._abstract_view
+        abstract_view.update(error_message or "No article selected")
+        self.update_results_title()
+        self._populate_table()
+        self._results_table.focus()
 
     def _populate_table(self):
         """Populate the DataTable with search results."""
-        table = self.query_one("#results_table", ArticleTableWidget)
+        table = self._results_table
         table.populate_articles(self.search_results, self.current_results_from_global)
-        
-        # Refresh left panel counts after populating table
-        self.refresh_left_panel_counts()
 
 
 
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Handle row highlighting in the DataTable."""
-        abstract_view = self.query_one("#abstract_content", Static)
-        table = self.query_one("#results_table", ArticleTableWidget)
+        abstract_view = self._abstract_view
+        table = self._results_table
 
         if not self.search_results:
             return
@@ -868,16 +882,19 @@ class ArxivReaderApp(App):
             if selected_article is None:
                 return
 
-            # Mark as viewed in database if not saved and not already viewed
-            if (not (hasattr(selected_article, 'is_saved') and selected_article.is_saved) and
-                not (hasattr(selected_article, 'is_viewed') and selected_article.is_viewed)):
-                self.db.mark_article_viewed(selected_article.get_short_id())
+            # Mark as viewed if not saved and not already viewed; the database
+            # write is deferred so fast scrolling costs one transaction per flush
+            if not selected_article.is_saved and not selected_article.is_viewed:
+                self._pending_viewed.add(selected_article.get_short_id())
+                if self._viewed_flush_handle is None:
+                    self._viewed_flush_handle = self.set_timer(
+                        self.VIEWED_FLUSH_DELAY_SECONDS, self._flush_viewed
+                    )
                 selected_article.is_viewed = True
                 
                 # Update the status in the table using the correct article
                 status = table._build_status_string(selected_article, table.current_is_global_search)
                 table.update_cell_at(Coordinate(event.cursor_row, 0), status)
-                self.refresh_left_panel_counts()
 
             # Display article information
             self._display_article_info(selected_article, abstract_view)
@@ -887,13 +904,13 @@ class ArxivReaderApp(App):
     def _display_article_info(self, article, abstract_view):
         """Display article information in the abstract view."""
         summary = article.summary.replace("\n", " ")
-        authors = ", ".join(author.name for author in article.authors)
+        authors = article.authors_str
         pdf_url = article.pdf_url
-        categories = ", ".join(article.categories)
+        categories = article.categories_str
         
         # Get article tags
         article_id = article.get_short_id()
-        tags = self.db.get_article_tags(article_id)
+        tags = self._get_article_tags(article_id)
         tags_display = ""
         if tags:
             tags_str = ", ".join(tags)
@@ -902,7 +919,7 @@ class ArxivReaderApp(App):
 
 
         notes_display = ""
-        if hasattr(article, 'has_note') and article.has_note:
+        if article.has_note:
             notes_display = f"\n\n[bold]Notes:[/] This article has notes ([@click=\"app.manage_notes()\"]view/edit[/])."
 
         content = (
@@ -917,15 +934,50 @@ class ArxivReaderApp(App):
 
         abstract_view.update(content)
 
+    def _get_all_tags(self) -> List[Dict]:
+        """Get all tags with their article counts, read once per tag edit."""
+        if self._all_tags is None:
+            self._all_tags = self.db.get_all_tags()
+        return self._all_tags
+
+    def _get_article_tags(self, article_id: str) -> List[str]:
+        """Get an article's tags, remembered so moving the cursor does not query them again."""
+        cache = self._article_tags_cache
+        tags = cache.get(article_id)
+        if tags is not None:
+            cache.move_to_end(article_id)
+            return tags
+        tags = cache[article_id] = self.db.get_article_tags(article_id)
+        if len(cache) > self.ARTICLE_TAGS_CACHE_SIZE:
+            cache.popitem(last=False)
+        return tags
+
     # Action methods
     
     def action_open_link(self, url: str) -> None:
         """Open a URL in the default web browser."""
+        self._open_url_worker(url)
+
+    @work(thread=True, group="open-url")
+    def _open_url_worker(self, url: str) -> None:
+        """Worker to open a URL; launching the browser can block for a while."""
         webbrowser.open(url)
 
+    def _flush_viewed(self) -> None:
+        """Write the articles marked viewed since the last flush to the database."""
+        if self._viewed_flush_handle is not None:
+            self._viewed_flush_handle.stop()
+            self._viewed_flush_handle = None
+        if not self._pending_viewed:
+            return
+        article_ids = list(self._pending_viewed)
+        self._pending_viewed.clear()
+        self.db.mark_articles_viewed(article_ids)
+        self._schedule_counts_refresh()
+
     def action_save_article(self) -> None:
         """Toggle save/unsave for the currently selected article."""
-        table = self.query_one("#results_table", ArticleTableWidget)
+        table = self._results_table
         cursor_row = table.cursor_row
         if cursor_row is not None:
             selected_article = table.get_article_at_row(cursor_row)
@@ -934,7 +986,7 @@ class ArxivReaderApp(App):
             article_id = selected_article.get_short_id()
 
             # Check if article is currently saved
-            if hasattr(selected_article, 'is_saved') and selected_article.is_saved:
+            if selected_article.is_saved:
                 # Article is saved, so unsave it
                 if self.db.mark_article_unsaved(article_id):
                     selected_article.is_saved = False
@@ -947,34 +999,29 @@ class ArxivReaderApp(App):
                         # Otherwise, update the status icon
                         self._update_table_row_status(cursor_row, selected_article)
                     
-                    self.refresh_left_panel_counts()
+                    self._schedule_counts_refresh()
             else:
-                # Article is not saved, so save it
-                # For global search results, we need to add the article to database first
-                if self.current_results_from_global:
-                    try:
-                        if not self.db.add_article(selected_article):
-                            pass  # Article already exists in database, that's fine
-                    except Exception as e:
-                        self.notify(f"Error adding article to database: {e}", severity="error")
-                        return
+                # Article is not saved, so save it (saving always marks it viewed).
+                # Global search results are added to the database in the same transaction
+                article_to_add = selected_article if self.current_results_from_global else None
+                try:
+                    changed = self.db.save_article(article_id, article_to_add)
+                except Exception as e:
+                    self.notify(f"Error saving article: {e}", severity="error")
+                    return
                 
-                # Now mark as saved
-                if self.db.mark_article_saved(article_id):
+                if changed:
                     selected_article.is_saved = True
-                    self.notify(f"Saved {article_id}")
-                    
-                    # Always mark as viewed when saving
-                    self.db.mark_article_viewed(article_id)
                     selected_article.is_viewed = True
+                    self.notify(f"Saved {article_id}")
 
                     status = table._build_status_string(selected_article, table.current_is_global_search)
                     table.update_cell_at(Coordinate(cursor_row, 0), status)
-                    self.refresh_left_panel_counts()
+                    self._schedule_counts_refresh()
 
     def action_mark_unread(self) -> None:
         """Mark the currently selected article as unread."""
-        table = self.query_one("#results_table", ArticleTableWidget)
+        table = self._results_table
         cursor_row = table.cursor_row
         if cursor_row is not None:
             selected_article = table.get_article_at_row(cursor_row)
@@ -983,16 +1030,16 @@ class ArxivReaderApp(App):
             article_id = selected_article.get_short_id()
 
             # Only mark as unread if it's currently viewed and not saved
-            if (hasattr(selected_article, 'is_viewed') and selected_article.is_viewed and 
-                not (hasattr(selected_article, 'is_saved') and selected_article.is_saved)):
+            if selected_article.is_viewed and not selected_article.is_saved:
+                self._flush_viewed()
                 if self.db.mark_article_unread(article_id):
                     selected_article.is_viewed = False
                     self.notify(f"Marked {article_id} as unread")
                     
                     status = table._build_status_string(selected_article, table.current_is_global_search)
                     table.update_cell_at(Coordinate(cursor_row, 0), status)
-                    self.refresh_left_panel_counts()
-            elif hasattr(selected_article, 'is_saved') and selected_article.is_saved:
+                    self._schedule_counts_refresh()
+            elif selected_article.is_saved:
                 self.notify(f"Cannot mark saved article as unread")
             else:
                 self.notify(f"Article is already unread")
@@ -1003,8 +1050,7 @@ class ArxivReaderApp(App):
             self.notify("No articles to mark as read", severity="warning")
             return
 
-        table = self.query_one("#results_table", ArticleTableWidget)
-        marked_count = 0
+        to_mark = []
         skipped_count = 0
 
         for row_index, article in enumerate(self.search_results):
@@ -1019,19 +1065,22 @@ class ArxivReaderApp(App):
                     self.notify(f"Error adding article {article_id} to database: {e}", severity="error")
                     continue
 
-            # Only mark as viewed if it's not already viewed and not saved
-            if not (hasattr(article, 'is_viewed') and article.is_viewed):
-                if self.db.mark_article_viewed(article_id):
-                    article.is_viewed = True
-                    marked_count += 1
-                    
-                    # Update table cell - only if not saved
-                    if not (hasattr(article, 'is_saved') and article.is_saved):
-                        self._update_table_row_status(row_index, article)
+            # Only mark as viewed if it's not already viewed
+            if not article.is_viewed:
+                to_mark.append((row_index, article))
             else:
                 skipped_count += 1
 
-        self.refresh_left_panel_counts()
+        # Write all viewed marks in a single transaction
+        self.db.mark_articles_viewed([article.get_short_id() for _, article in to_mark])
+        for row_index, article in to_mark:
+            article.is_viewed = True
+            # Update table cell - only if not saved
+            if not article.is_saved:
+                self._update_table_row_status(row_index, article)
+        marked_count = len(to_mark)
+
+        self._schedule_counts_refresh()
 
         # Provide user feedback
         if marked_count > 0:
@@ -1044,7 +1093,7 @@ class ArxivReaderApp(App):
 
     def action_download_and_open_pdf(self) -> None:
         """Download the PDF for the selected article and open it."""
-        table = self.query_one("#results_table", ArticleTableWidget)
+        table = self._results_table
         cursor_row = table.cursor_row
         if cursor_row is not None:
             selected_article = table.get_article_at_row(cursor_row)
@@ -1054,7 +1103,7 @@ class ArxivReaderApp(App):
 
     def action_open_arxiv_link(self) -> None:
         """Open the arXiv link for the selected article in browser."""
-        table = self.query_one("#results_table", ArticleTableWidget)
+        table = self._results_table
         cursor_row = table.cursor_row
         if cursor_row is not None:
             selected_article = table.get_article_at_row(cursor_row)
@@ -1062,7 +1111,7 @@ class ArxivReaderApp(App):
                 return
             article_id = selected_article.get_short_id()
             arxiv_url = f"https://arxiv.org/abs/{article_id}"
-            webbrowser.open(arxiv_url)
+            self._open_url_worker(arxiv_url)
             self.notify(f"Opened arXiv link for {article_id}")
         else:
             self.notify("No article selected", severity="warning")
@@ -1071,24 +1120,29 @@ class ArxivReaderApp(App):
     def download_and_open_worker(self, selected_article) -> None:
         """Worker to download and open PDF."""
         article_id = selected_article.get_short_id()
-        self.notify(f"Downloading {article_id}...", title="Download", timeout=10)
+        self.call_from_thread(self.notify, f"Downloading {article_id}...", title="Download", timeout=10)
 
         articles_dir = self.user_dirs.articles_dir
         try:
             # Directory is already created by UserDirectoryManager
             filepath = selected_article.download_pdf(dirpath=articles_dir)
 
+            # Wait for the launcher here in the worker so failures are reported and it
+            # is reaped; its output must not reach the TUI
             system = platform.system()
             if system == "Darwin":  # macOS
-                subprocess.run(["open", filepath], check=True)
+                subprocess.run(["open", filepath], check=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             elif system == "Windows":
                 os.startfile(filepath)
             else:  # linux variants
-                subprocess.run(["xdg-open", filepath], check=True)
+                subprocess.run(["xdg-open", filepath], check=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-            self.notify(f"Opened {article_id}.pdf", title="Success")
+            self.call_from_thread(self.notify, f"Opened {article_id}.pdf", title="Success")
         except Exception as e:
-            self.notify(
+            self.call_from_thread(
+                self.notify,
                 f"Error downloading or opening PDF: {e}",
                 title="Error",
                 severity="error",
@@ -1096,17 +1150,17 @@ class ArxivReaderApp(App):
 
     def action_focus_search(self) -> None:
         """Focus the search input."""
-        self.query_one("#search_input", Input).focus()
+        self._search_input.focus()
 
     def action_global_search_and_focus(self) -> None:
         """Enable global search and focus the search input."""
         # Enable global search
         self.global_search_enabled = True
-        global_search_checkbox = self.query_one("#global_search_checkbox", Checkbox)
+        global_search_checkbox = self._global_search_checkbox
         global_search_checkbox.value = True
         
         # Focus the search input
-        self.query_one("#search_input", Input).focus()
+        self._search_input.focus()
 
     def action_show_advanced_search(self) -> None:
         """Show the advanced search popup."""
@@ -1114,35 +1168,61 @@ class ArxivReaderApp(App):
 
     def action_show_selection_popup(self) -> None:
         """Show a popup to select a view (category, filter, or saved)."""
-        config = self.config_manager.get_config()
-        
-        options = [
-            ("Unread", "special:unread_articles_filter"),
-            ("Saved", "special:saved_articles_filter")
-        ]
-
-        filter_options = [
-            (f"Filter: {name}", f"filter:{name}") for name in config.get("filters", {})
-        ]
+        self.push_screen(
+            SelectionPopupScreen(self._get_popup_options()), self.selection_popup_callback
+        )
 
-        category_options = [
-            (f"Category: {name}", f"cat:{code}")
-            for name, code in config.get("categories", {}).items()
-        ]
+    def _get_popup_options(self) -> List[tuple]:
+        """Return the selection popup options for the current config."""
+        config = self.config_manager.get_config()
+        # Rebuilt only when the config dict is replaced on reload
+        if self._popup_options_config is not config:
+            # Option values are (kind, value) tuples handed back verbatim by the popup
+            options = [
+                ("Unread", ("special", "unread_articles_filter")),
+                ("Saved", ("special", "saved_articles_filter"))
+            ]
+            options.extend(
+                (f"Filter: {name}", ("filter", name)) for name in config.get("filters", {}).keys()
+            )
+            options.extend(
+                (f"Category: {name}", ("cat", code))
+                for name, code in config.get("categories", {}).items()
+            )
 
-        all_options = options + filter_options + category_options
+            self._popup_options = options
+            self._popup_options_config = config
 
-        self.push_screen(
-            SelectionPopupScreen(all_options), self.selection_popup_callback
-        )
+            # (kind, value) -> (list view id, item id) for highlighting the chosen view
+            self._selection_targets = {
+                ("special", "unread_articles_filter"): ("feed_articles_list", "unread_articles_filter"),
+                ("special", "saved_articles_filter"): ("library_articles_list", "saved_articles_filter"),
+            }
+            for name in config.get("filters", {}):
+                self._selection_targets[("filter", name)] = (
+                    "filters_list", f"filter_{sanitize_widget_id(name)}"
+                )
+            for code in config.get("categories", {}).values():
+                # Sanitize category code for ID (dots are not allowed)
+                self._selection_targets[("cat", code)] = (
+                    "categories_list", f"cat_{sanitize_widget_id(code)}"
+                )
+        return self._popup_options
 
     def action_refresh_articles(self) -> None:
         """Manually refresh and fetch new articles."""
+        # Drop repeated keypresses while a refresh runs or right after one finished;
+        # thread workers can't be cancelled, so each extra call would fetch again
+        if self.is_refreshing:
+            return
+        if time.monotonic() - self._last_refresh_finished < self.REFRESH_COOLDOWN_SECONDS:
+            return
+        self._set_refreshing_state(True)
         self.manual_refresh_articles()
 
     def action_show_inspire_citation(self) -> None:
         """Show inspire-hep citation for the currently selected article."""
-        table = self.query_one("#results_table", ArticleTableWidget)
+        table = self._results_table
         cursor_row = table.cursor_row
         if cursor_row is not None:
             selected_article = table.get_article_at_row(cursor_row)
@@ -1154,7 +1234,7 @@ class ArxivReaderApp(App):
 
     def action_manage_tags(self) -> None:
         """Show tag management popup for the currently selected article."""
-        table = self.query_one("#results_table", ArticleTableWidget)
+        table = self._results_table
         cursor_row = table.cursor_row
         if cursor_row is not None:
             selected_article = table.get_article_at_row(cursor_row)
@@ -1168,7 +1248,7 @@ class ArxivReaderApp(App):
 
     def action_manage_notes(self) -> None:
         """Open the notes popup for the currently selected article."""
-        table = self.query_one("#results_table", ArticleTableWidget)
+        table = self._results_table
         cursor_row = table.cursor_row
         if cursor_row is not None:
             selected_article = table.get_article_at_row(cursor_row)
@@ -1178,6 +1258,10 @@ class ArxivReaderApp(App):
         else:
             self.notify("No article selected", severity="warning")
 
+    def on_unmount(self) -> None:
+        """Write out viewed marks that are still pending."""
+        self._flush_viewed()
+
     def action_quit(self) -> None:
         """Quit the application."""
         self.exit()
@@ -1196,22 +1280,29 @@ class ArxivReaderApp(App):
                 return
 
         article_id = article.get_short_id()
-        notes_path_str = self.db.get_notes_path(article_id)
+        if self.current_results_from_global:
+            # arXiv results do not carry the path of notes written on an earlier visit
+            notes_path_str = self.db.get_notes_path(article_id)
+        else:
+            notes_path_str = article.notes_file_path
 
         if not notes_path_str:
             # Create a new notes file using user directory manager
             notes_path_str = self.user_dirs.get_notes_file_path(article_id, article.title)
             
-            # Create the file and update database
-            with open(notes_path_str, "w") as f:
-                f.write(f"# Notes for: {article.title}\n\n")
+            # Create the file unless notes from an earlier session are still there
+            try:
+                with open(notes_path_str, "x") as f:
+                    f.write(f"# Notes for: {article.title}\n\n")
+            except FileExistsError:
+                pass
             
             self.db.set_notes_path(article_id, notes_path_str)
 
             # Update article object and table view
             article.notes_file_path = notes_path_str
             article.has_note = True
-            table = self.query_one("#results_table", ArticleTableWidget)
+            table = self._results_table
             if table.cursor_row is not None:
                 self._update_table_row_status(table.cursor_row, article)
 
@@ -1231,7 +1322,7 @@ class ArxivReaderApp(App):
                     self.db.clear_notes_path(article_id)
                     
                     # Update the UI to reflect the deletion
-                    table = self.query_one("#results_table", ArticleTableWidget)
+                    table = self._results_table
                     cursor_row = table.cursor_row
                     if cursor_row is not None:
                         selected_article = table.get_article_at_row(cursor_row)
@@ -1247,7 +1338,7 @@ class ArxivReaderApp(App):
             elif isinstance(result, str):
                 # When notes are saved, update the UI to reflect the saved status
                 # (the article is automatically marked as saved in set_notes_path)
-                table = self.query_one("#results_table", ArticleTableWidget)
+                table = self._results_table
                 cursor_row = table.cursor_row
                 if cursor_row is not None:
                     selected_article = table.get_article_at_row(cursor_row)
@@ -1262,8 +1353,9 @@ class ArxivReaderApp(App):
     def show_tag_popup(self, article) -> None:
         """Show the tag management popup for an article."""
         article_id = article.get_short_id()
-        existing_tags = self.db.get_article_tags(article_id)
-        all_tags = self.db.get_all_tags()
+        existing_tags = self._get_article_tags(article_id)
+        # The popup appends tags created in it to its list, so give it a copy
+        all_tags = list(self._get_all_tags())
         
         self.push_screen(
             TagPopupScreen(article_id, article.title, existing_tags, all_tags),
@@ -1279,7 +1371,7 @@ class ArxivReaderApp(App):
             
         tags_to_add, tags_to_remove = result
         
-        table = self.query_one("#results_table", ArticleTableWidget)
+        table = self._results_table
         cursor_row = table.cursor_row
         
         if cursor_row is not None:
@@ -1297,25 +1389,20 @@ class ArxivReaderApp(App):
                     self.notify(f"Error adding article to database: {e}", severity="error")
                     return
             
-            # Remove tags
-            for tag_name in tags_to_remove:
-                self.db.remove_article_tag(article_id, tag_name)
-            
-            # Add tags (this automatically marks article as saved)
-            tags_added = False
-            for tag_name in tags_to_add:
-                if self.db.add_article_tag(article_id, tag_name):
-                    tags_added = True
-            
-            # Cleanup any orphan tags
-            if tags_to_remove:
-                removed_count = self.db.cleanup_orphan_tags()
-                if removed_count > 0:
-                    self.notify(f"Removed {removed_count} unused tag(s).", timeout=3)
+            # Remove and add tags in one transaction; adding marks the article as
+            # saved and removing deletes tags that end up unused
+            tags_added, removed_count = self.db.update_article_tags(
+                article_id, tags_to_add, tags_to_remove
+            )
+            self._article_tags_cache.pop(article_id, None)
+            self._all_tags = None
+            if removed_count > 0:
+                self.notify(f"Removed {removed_count} unused tag(s).", timeout=3)
 
             # Update article's has_tags and saved status
             if tags_to_add or tags_to_remove:
-                selected_article.has_tags = self.db.article_has_tags(article_id)
+                # One tag query refills the cache for the abstract view as well
+                selected_article.has_tags = bool(self._get_article_tags(article_id))
                 
                 # If tags were added, the article is now saved (done automatically in add_article_tag)
                 if tags_added:
@@ -1323,13 +1410,15 @@ class ArxivReaderApp(App):
                 
                 # Update the table row status to show/hide "t" and "s" indicators
                 self._update_table_row_status(cursor_row, selected_article)
+                self._display_article_info(selected_article, self._abstract_view)
                 
-                
-                # Reload left panel to show new tags if any were created
-                self.call_later(self.reload_left_panel)
+                # Reload the tag list only if tags were created or deleted;
+                # otherwise just the counts below change
+                if removed_count > 0 or not self._tag_names.issuperset(tags_to_add):
+                    self.call_later(self.reload_left_panel)
                 
                 # Refresh all left panel counts
-                self.refresh_left_panel_counts()
+                self._schedule_counts_refresh()
             
             if tags_to_add or tags_to_remove:
                 if tags_added:
@@ -1354,19 +1443,18 @@ class ArxivReaderApp(App):
                 self.current_query = ""
                 
                 # Deselect all list views
-                for list_view in self.query(ListView):
-                    list_view.index = None
+                self._set_active_list_view(None)
                 
                 # Clear search input and disable global search checkbox
-                search_input = self.query_one("#search_input", Input)
+                search_input = self._search_input
                 search_input.value = ""
-                global_search_checkbox = self.query_one("#global_search_checkbox", Checkbox)
+                global_search_checkbox = self._global_search_checkbox
                 global_search_checkbox.value = False
                 self.global_search_enabled = False
                 
                 # Clear table and show loading state immediately
-                table = self.query_one("#results_table", ArticleTableWidget)
-                abstract_view = self.query_one("#abstract_content", Static)
+                table = self._results_table
+                abstract_view = self._abstract_view
                 table.clear()
                 abstract_view.update("Loading reference articles...")
                 self.search_results = []
@@ -1390,19 +1478,18 @@ class ArxivReaderApp(App):
                 self.current_query = ""
                 
                 # Deselect all list views
-                for list_view in self.query(ListView):
-                    list_view.index = None
+                self._set_active_list_view(None)
                 
                 # Clear search input and disable global search checkbox
-                search_input = self.query_one("#search_input", Input)
+                search_input = self._search_input
                 search_input.value = ""
-                global_search_checkbox = self.query_one("#global_search_checkbox", Checkbox)
+                global_search_checkbox = self._global_search_checkbox
                 global_search_checkbox.value = False
                 self.global_search_enabled = False
                 
                 # Clear table and show loading state immediately
-                table = self.query_one("#results_table", ArticleTableWidget)
-                abstract_view = self.query_one("#abstract_content", Static)
+                table = self._results_table
+                abstract_view = self._abstract_view
                 table.clear()
                 abstract_view.update("Loading citing articles...")
                 self.search_results = []
@@ -1425,48 +1512,38 @@ class ArxivReaderApp(App):
     def fetch_inspire_citation(self, article) -> None:
         """Worker to fetch bibtex citation from inspire-hep."""
         article_id = article.get_short_id()
-        self.call_from_thread(
-            self.notify, 
-            f"Fetching citation for {article_id}...", 
-            title="Inspire-HEP", 
-            timeout=5
-        )
+        base_article_id = article_id.split('v')[0] if 'v' in article_id else article_id
 
-        # get literature entry
-        client = Client()
         try:
-            base_article_id = article_id.split('v')[0] if 'v' in article_id else article_id
-            search_url = f"https://inspirehep.net/api/literature?q=arxiv:{base_article_id}&format=json"
-            response = requests.get(search_url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            if not data.get('hits') or len(data['hits']['hits']) == 0:
+            citation = self.db.get_cached_citation(base_article_id, self.CITATION_CACHE_TTL_SECONDS)
+            if citation is None:
                 self.call_from_thread(
-                    self.notify,
-                    f"No citation found for {base_article_id}",
+                    self.notify, 
+                    f"Fetching citation for {article_id}...", 
                     title="Inspire-HEP", 
-                    severity="warning",
                     timeout=5
                 )
-                return
-            # Get inspire ID from first result
-            inspire_id = data['hits']['hits'][0]['metadata'].get('control_number')
-            literature_entry = client.get_literature_object(str(inspire_id))
-            n_citations = literature_entry.get_citation_count()
-            n_citations_text = f"Citations: {n_citations}"
+                citation = self._fetch_citation_from_inspire(base_article_id)
+                if citation is None:
+                    self.call_from_thread(
+                        self.notify,
+                        f"No citation found for {base_article_id}",
+                        title="Inspire-HEP", 
+                        severity="warning",
+                        timeout=5
+                    )
+                    return
+                self.db.cache_citation(base_article_id, **citation)
+
+            inspire_id = citation['inspire_id']
+            bibtex_content = citation['bibtex']
+            n_citations = citation['n_citations']
             self.call_from_thread(
                 self.notify,
-                n_citations_text,
+                f"Citations: {n_citations}",
                 title="Inspire-HEP",
                 timeout=5
             )
-            references = literature_entry.get_references_ids()
-            # Get bibtex entry
-            bibtex_url = f"https://inspirehep.net/api/literature?q=arxiv:{base_article_id}&format=bibtex"
-            bibtex_response = requests.get(bibtex_url, timeout=10)
-            bibtex_response.raise_for_status()
-            
-            bibtex_content = bibtex_response.text
 
             inspire_link = f"https://inspirehep.net/literature/{inspire_id}"
             
@@ -1486,7 +1563,7 @@ class ArxivReaderApp(App):
                 'n_citations': n_citations,
                 'inspire_link': inspire_link,
                 'article_title': article.title,
-                'references': references,
+                'references': citation['reference_ids'],
                 'inspire_id': inspire_id
             }
             self.call_from_thread(self._push_bibtex_screen, screen_data)
@@ -1499,24 +1576,41 @@ class ArxivReaderApp(App):
                 severity="error",
                 timeout=5
             )
-    
+
+    def _fetch_citation_from_inspire(self, base_article_id: str) -> Optional[Dict[str, Any]]:
+        """Look up an arXiv article on Inspire-HEP; None if it has no record there."""
+        from pyinspirehep import Client
+
+        session = get_http_session()
+        search_url = f"https://inspirehep.net/api/literature?q=arxiv:{base_article_id}&format=json"
+        response = session.get(search_url, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        if not data.get('hits') or len(data['hits']['hits']) == 0:
+            return None
+
+        # Get inspire ID from first result
+        inspire_id = data['hits']['hits'][0]['metadata'].get('control_number')
+
+        # The BibTeX request does not depend on the record, so run it alongside
+        bibtex_url = f"https://inspirehep.net/api/literature?q=arxiv:{base_article_id}&format=bibtex"
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            bibtex_future = executor.submit(session.get, bibtex_url, timeout=10)
+            literature_entry = Client().get_literature_object(str(inspire_id))
+            bibtex_response = bibtex_future.result()
+        bibtex_response.raise_for_status()
+
+        return {
+            'inspire_id': inspire_id,
+            'bibtex': bibtex_response.text,
+            'n_citations': literature_entry.get_citation_count(),
+            'reference_ids': literature_entry.get_references_ids(),
+        }
+
     def _copy_to_clipboard(self, content: str) -> None:
         """Copy content to clipboard. Must be called from main thread."""
         try:
-            if platform.system() == "Darwin":
-                subprocess.run(["pbcopy"], input=content.encode(), timeout=3, check=True)
-            elif platform.system() == "Linux":
-                # Try Wayland first, then X11 tools
-                for cmd in (["wl-copy"], ["xclip", "-selection", "clipboard"], ["xsel", "--clipboard", "--input"]):
-                    try:
-                        subprocess.run(cmd, input=content.encode(), timeout=3, check=True)
-                        return
-                    except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
-                        continue
-                # Fall back to pyperclip as last resort
-                pyperclip.copy(content)
-            else:
-                pyperclip.copy(content)
+            copy_to_clipboard(content)
         except Exception as e:
             self.notify(f"Failed to copy to clipboard: {str(e)}", severity="warning", timeout=3)
     
@@ -1544,19 +1638,18 @@ class ArxivReaderApp(App):
         self.current_selection = None
         
         # Deselect all list views
-        for list_view in self.query(ListView):
-            list_view.index = None
+        self._set_active_list_view(None)
         
         # Set the search parameters
         self.current_query = search_params["query"]
         self.advanced_search_params = search_params
         
         # Update search input with the formatted query
-        search_input = self.query_one("#search_input", Input)
+        search_input = self._search_input
         search_input.value = search_params["query"]
         
         # Enable global search mode
-        global_search_checkbox = self.query_one("#global_search_checkbox", Checkbox)
+        global_search_checkbox = self._global_search_checkbox
         global_search_checkbox.value = True
         self.global_search_enabled = True
         
@@ -1566,11 +1659,10 @@ class ArxivReaderApp(App):
         
         # Update title and trigger search
         self.update_results_title()
-        self.refresh_left_panel_counts()
         
         # Clear table and show loading
-        table = self.query_one("#results_table", ArticleTableWidget)
-        abstract_view = self.query_one("#abstract_content", Static)
+        table = self._results_table
+        abstract_view = self._abstract_view
         table.clear()
         abstract_view.update("Loading search results...")
         self.search_results = []
@@ -1598,43 +1690,29 @@ class ArxivReaderApp(App):
         if not selection_value:
             return
 
-        # Deselect any currently selected button first
-        for list_view in self.query(ListView):
-            list_view.index = None
+        _, value = selection_value
+        # Re-picking the view that is already shown would only reload the same rows
+        if value == self.current_selection and not self.current_results_from_global:
+            return
 
-        value_type, value = selection_value.split(":", 1)
+        # Deselect the currently selected item first
+        self._set_active_list_view(None)
 
-        target_list_view_id = ""
-        target_item_id = ""
+        self.current_selection = value
 
-        if value_type == "special":
-            self.current_selection = value
-            if value == "saved_articles_filter":
-                target_list_view_id = "library_articles_list"
-            else:
-                target_list_view_id = "feed_articles_list"
-            target_item_id = value
-        elif value_type == "filter":
-            self.current_selection = value
-            target_list_view_id = "filters_list"
-            target_item_id = f"filter_{value.replace(' ', '_')}"
-        elif value_type == "cat":
-            self.current_selection = value
-            target_list_view_id = "categories_list"
-            # Sanitize category code for ID (dots are not allowed)
-            sanitized_value = re.sub(r'[^a-zA-Z0-9_-]', '_', value)
-            target_item_id = f"cat_{sanitized_value}"
+        # The targets are built alongside the options, so make sure they are current
+        self._get_popup_options()
+        target_list_view_id, target_item_id = self._selection_targets.get(selection_value, ("", ""))
 
         if target_list_view_id and target_item_id:
-            try:
-                target_list_view = self.query_one(f"#{target_list_view_id}", ListView)
+            target_list_view = self._get_list_view(target_list_view_id)
+            if target_list_view is not None:
                 # Find the item index by its ID
                 for i, item in enumerate(target_list_view.children):
                     if item.id == target_item_id:
                         target_list_view.index = i
+                        self._set_active_list_view(target_list_view)
                         break
-            except Exception:
-                pass # It might not exist
 
         self.load_articles()
 
@@ -1642,9 +1720,10 @@ class ArxivReaderApp(App):
     
     def update_results_title(self) -> None:
         """Update the results table title based on current selection."""
+        results_title = self._results_title
+        if results_title is None:
+            return  # Not mounted yet
         try:
-            results_title = self.query_one("#results_title", Static)
-            
             # Check if we're showing global search results
             if self.current_results_from_global and self.current_query:
                 title = "ArXiv Web Search"
@@ -1675,13 +1754,9 @@ class ArxivReaderApp(App):
                     elif self.current_selection in self.config_manager.get_filters():
                         title = f"Filter: {self.current_selection}"
                     else:
-                        # Check categories
-                        config = self.config_manager.get_config()
-                        categories = config.get("categories", {})
-                        for name, code in categories.items():
-                            if code == self.current_selection:
-                                title = f"Category: {name}"
-                                break
+                        category_name = self._get_category_names_by_code().get(self.current_selection)
+                        if category_name is not None:
+                            title = f"Category: {category_name}"
                 
                 # Add search info if there's a query (for local search only)
                 if self.current_query and not self.current_results_from_global:
@@ -1691,127 +1766,123 @@ class ArxivReaderApp(App):
         except Exception:
             pass  # Don't let title update errors break the app
 
+    def _get_category_names_by_code(self) -> Dict[str, str]:
+        """Return the category code -> display name map for the current config."""
+        config = self.config_manager.get_config()
+        # The config dict is replaced on reload, so identity tells us when to rebuild
+        if self._category_names_config is not config:
+            self._category_names_config = config
+            self._category_names_by_code = {
+                code: name for name, code in config.get("categories", {}).items()
+            }
+        return self._category_names_by_code
+
+    def _get_left_panel_counts(self) -> Dict[str, Dict[str, int]]:
+        """Fetch every left-panel count for the current config in one query."""
+        config = self.config_manager.get_config()
+        return self.db.get_left_panel_counts(
+            config.get("filters", {}),
+            list(config.get("categories", {}).values()),
+            config.get("feed_retention_days", 30),
+        )
+
+    def _schedule_counts_refresh(self) -> None:
+        """Request a left-panel count refresh, coalescing bursts of requests."""
+        if self._counts_refresh_handle is not None:
+            self._counts_refresh_handle.stop()
+        self._counts_refresh_handle = self.set_timer(
+            self.COUNTS_REFRESH_DELAY_SECONDS, self._start_counts_refresh
+        )
+
+    def _start_counts_refresh(self) -> None:
+        """Timer callback: forget the fired handle on the UI thread, then start the worker."""
+        self._counts_refresh_handle = None
+        self.refresh_left_panel_counts()
+
+    @work(exclusive=True, thread=True, group="left-panel-counts")
     def refresh_left_panel_counts(self) -> None:
-        """Update the unread counts in the left panel."""
+        """Query the left-panel counts in a worker and apply them on the UI thread."""
+        worker = get_current_worker()
         try:
-            # Update All articles count
-            try:
-                all_count = self.db.get_all_articles_count()
-                all_text = f"All articles"
-                all_item = self.query_one("#all_articles_filter", ListItem)
-                all_static = all_item.query_one(Static)
-                all_static.update(all_text)
-            except Exception:
-                pass
-                
-            # Update Unread count
-            unread_count = self.db.get_unread_count()
-            unread_text = f"Unread ({unread_count})" if unread_count > 0 else "Unread"
-            try:
-                unread_item = self.query_one("#unread_articles_filter", ListItem)
-                unread_static = unread_item.query_one(Static)
-                unread_static.update(unread_text)
-            except Exception:
-                pass
-            
-            # Update Saved Articles count
-            # saved_unread_count = self.db.get_unread_saved_count()
-            saved_count = self.db.get_saved_articles_count()
-            saved_text = f"Saved ({saved_count})" if saved_count > 0 else "Saved"
-            try:
-                saved_item = self.query_one("#saved_articles_filter", ListItem)
-                saved_static = saved_item.query_one(Static)
-                saved_static.update(saved_text)
-            except Exception:
-                pass
-            
-            # Update Notes count
-            # notes_unread_count = self.db.get_unread_count_with_notes()
-            notes_count = self.db.get_articles_with_notes_count()
-            notes_text = f"Notes ({notes_count})" if notes_count > 0 else "Notes"
-            try:
-                notes_item = self.query_one("#notes_articles_filter", ListItem)
-                notes_static = notes_item.query_one(Static)
-                notes_static.update(notes_text)
-            except Exception:
-                pass
-            
+            counts = self._get_left_panel_counts()
 
-            self._update_tag_counts()
-            self._update_filter_counts()
-            self._update_category_counts()
-                        
-        except Exception as e:
+            def apply_counts() -> None:
+                # A newer refresh cancels this worker but cannot stop its query;
+                # checked on the UI thread so stale counts never overwrite newer ones
+                if not worker.is_cancelled:
+                    self._apply_left_panel_counts(counts)
+
+            self.call_from_thread(apply_counts)
+        except Exception:
             # Don't let count refresh errors break the app
             pass
 
+    def _store_header_counts(self, totals: Dict[str, int]) -> None:
+        """Remember the feed and library sizes shown in the header status."""
+        self._header_counts = (totals.get("feed", 0), totals.get("saved", 0))
 
+    def _apply_left_panel_counts(self, counts: Dict[str, Dict[str, int]]) -> None:
+        """Update the unread counts in the left panel and the header status."""
+        totals = counts["totals"]
+        self._store_header_counts(totals)
+        self.update_header_status()
 
+        # Update Unread count
+        unread_count = totals.get("unread", 0)
+        unread_text = f"Unread ({unread_count})" if unread_count > 0 else "Unread"
+        self._set_menu_text("unread_articles_filter", unread_text)
+        
+        # Update Saved Articles count
+        saved_count = totals.get("saved", 0)
+        saved_text = f"Saved ({saved_count})" if saved_count > 0 else "Saved"
+        self._set_menu_text("saved_articles_filter", saved_text)
+        
+        # Update Notes count
+        notes_count = totals.get("notes", 0)
+        notes_text = f"Notes ({notes_count})" if notes_count > 0 else "Notes"
+        self._set_menu_text("notes_articles_filter", notes_text)
 
+        self._update_tag_counts(counts["tags"])
+        self._update_filter_counts(counts["filters"])
+        self._update_category_counts(counts["categories"])
 
-    def _update_tag_counts(self):
+    def _update_tag_counts(self, tag_counts: Dict[str, int]):
         """Update tag counts in the left panel."""
-        all_tags = self.db.get_all_tags()
-        for tag in all_tags:
-            unread_count = self.db.get_unread_count_by_tag(tag['name'])
-            tag_text = f"{tag['name']} ({unread_count})" if unread_count > 0 else tag['name']
-            sanitized_tag_name = re.sub(r'[^a-zA-Z0-9_-]', '_', tag['name'])
-            
-            tag_widget_id = f"tag_{sanitized_tag_name}"
-            try:
-                tag_item = self.query_one(f"#{tag_widget_id}", ListItem)
-                tag_static = tag_item.query_one(Static)
-                tag_static.update(tag_text)
-            except Exception:
-                pass  # Widget might not exist yet
+        for tag_name, unread_count in tag_counts.items():
+            tag_text = f"{tag_name} ({unread_count})" if unread_count > 0 else tag_name
+            self._set_menu_text(f"tag_{sanitize_widget_id(tag_name)}", tag_text)
 
-    def _update_filter_counts(self):
+    def _update_filter_counts(self, filter_counts: Dict[str, int]):
         """Update filter counts in the left panel."""
-        config = self.config_manager.get_config()
-        retention_days = config.get("feed_retention_days", 30)
-        filters = config.get("filters", {})
-        for name, filter_config in filters.items():
-            unread_count = self.db.get_unread_count_by_filter(filter_config, retention_days)
+        filters = self.config_manager.get_config().get("filters", {})
+        for name in filters:
+            unread_count = filter_counts.get(name, 0)
             filter_text = f"{name} ({unread_count})" if unread_count > 0 else name
             
-            filter_widget_id = f"filter_{name.replace(' ', '_')}"
-            try:
-                filter_item = self.query_one(f"#{filter_widget_id}", ListItem)
-                filter_static = filter_item.query_one(Static)
-                filter_static.update(filter_text)
-            except Exception:
-                pass  # Widget might not exist yet
+            self._set_menu_text(f"filter_{sanitize_widget_id(name)}", filter_text)
 
-    def _update_category_counts(self):
+    def _update_category_counts(self, category_counts: Dict[str, int]):
         """Update category counts in the left panel."""
-        config = self.config_manager.get_config()
-        retention_days = config.get("feed_retention_days", 30)
-        categories = config.get("categories", {})
+        categories = self.config_manager.get_config().get("categories", {})
         for name, code in categories.items():
-            unread_count = self.db.get_unread_count_by_category(code, retention_days)
+            unread_count = category_counts.get(code, 0)
             category_text = f"{name} ({unread_count})" if unread_count > 0 else name
             
-            # Sanitize category code for querying (dots are not allowed in IDs)
-            sanitized_code = re.sub(r'[^a-zA-Z0-9_-]', '_', code)
-            
-            try:
-                category_item = self.query_one(f"#cat_{sanitized_code}", ListItem)
-                category_static = category_item.query_one(Static)
-                category_static.update(category_text)
-            except Exception:
-                pass  # Widget might not exist yet
+            # Sanitize category code for the item ID (dots are not allowed in IDs)
+            sanitized_code = sanitize_widget_id(code)
+            self._set_menu_text(f"cat_{sanitized_code}", category_text)
 
     def _update_table_row_status(self, row_index: int, article) -> None:
         """Update the status column for a specific table row."""
-        table = self.query_one("#results_table", ArticleTableWidget)
-        status = table._build_status_string(article, table.current_is_global_search)
-        table.update_cell_at(Coordinate(row_index, 0), status)
+        table = self._results_table
+        table.update_row_status(row_index, article, table.current_is_global_search)
 
     def _set_refreshing_state(self, is_refreshing: bool) -> None:
         """Track whether a refresh is in progress and update header status."""
         self.is_refreshing = is_refreshing
         if not is_refreshing:
             self._refresh_spinner_index = 0
+            self._last_refresh_finished = time.monotonic()
         self.update_header_status()
 
     def _set_refresh_progress_text(self, text: str) -> None:
@@ -1875,6 +1946,9 @@ class ArxivReaderApp(App):
             self._set_refresh_progress_text(
                 f"Done {completed_batches}/{total_batches}: {batch_type} {batch_name} (+{added_count}){error_suffix}{delay_text}"
             )
+            # Let unread counts grow batch by batch instead of only at the end
+            if added_count:
+                self._schedule_counts_refresh()
             return
 
         if event == "refresh_completed":
@@ -1887,8 +1961,8 @@ class ArxivReaderApp(App):
     def _show_refresh_loading_indicator(self) -> None:
         """Show a loading hint when refresh starts and the table is empty."""
         try:
-            table = self.query_one("#results_table", ArticleTableWidget)
-            abstract_view = self.query_one("#abstract_content", Static)
+            table = self._results_table
+            abstract_view = self._abstract_view
 
             if table.row_count == 0:
                 table.clear()
@@ -1915,7 +1989,7 @@ class ArxivReaderApp(App):
         try:
             feed_container = self.query_one("#feed_container", Vertical)
             config = self.config_manager.get_config()
-            retention_days = config.get("feed_retention_days", 30)
+            counts = self._get_left_panel_counts()
 
             # Remove stale containers — must be awaited so the DOM is clear
             # before we mount new widgets with the same IDs
@@ -1924,37 +1998,39 @@ class ArxivReaderApp(App):
                     await feed_container.query_one(widget_id).remove()
                 except Exception:
                     pass
+            for item_id in [key for key in self._menu_labels if key.startswith(("filter_", "cat_"))]:
+                del self._menu_labels[item_id]
 
             # Remount filters — mount the container first, then its children explicitly
             filters = config.get("filters", {})
             if filters:
                 filter_items = []
-                for name, filter_config in filters.items():
-                    unread_count = self.db.get_unread_count_by_filter(filter_config, retention_days)
+                for name in filters:
+                    unread_count = counts["filters"].get(name, 0)
                     filter_text = f"{name} ({unread_count})" if unread_count > 0 else name
-                    filter_items.append(
-                        ListItem(Static(filter_text), id=f"filter_{name.replace(' ', '_')}")
-                    )
+                    filter_item = self._menu_item(f"filter_{sanitize_widget_id(name)}", filter_text)
+                    filter_item.original_filter_name = name
+                    filter_items.append(filter_item)
                 filters_vertical = Vertical(id="filters_container")
                 await feed_container.mount(filters_vertical)
                 await filters_vertical.mount(Static("Filters", classes="pane_title sub_title"))
-                await filters_vertical.mount(ListView(*filter_items, id="filters_list"))
+                await filters_vertical.mount(ListView(*filter_items, initial_index=None, id="filters_list"))
 
             # Remount categories — mount the container first, then its children explicitly
             categories = config.get("categories", {})
             if categories:
                 category_items = []
                 for name, code in categories.items():
-                    unread_count = self.db.get_unread_count_by_category(code, retention_days)
+                    unread_count = counts["categories"].get(code, 0)
                     category_text = f"{name} ({unread_count})" if unread_count > 0 else name
-                    sanitized_code = re.sub(r'[^a-zA-Z0-9_-]', '_', code)
-                    cat_item = ListItem(Static(category_text), id=f"cat_{sanitized_code}")
+                    sanitized_code = sanitize_widget_id(code)
+                    cat_item = self._menu_item(f"cat_{sanitized_code}", category_text)
                     cat_item.original_category_code = code
                     category_items.append(cat_item)
                 categories_vertical = Vertical(id="categories_container")
                 await feed_container.mount(categories_vertical)
                 await categories_vertical.mount(Static("Categories", classes="pane_title sub_title"))
-                await categories_vertical.mount(ListView(*category_items, id="categories_list"))
+                await categories_vertical.mount(ListView(*category_items, initial_index=None, id="categories_list"))
         except Exception as e:
             self.notify(f"Sidebar rebuild error: {e}", severity="warning", timeout=6)
             debug_log(f"_rebuild_sidebar_feed_section error: {e}")
@@ -1962,7 +2038,9 @@ class ArxivReaderApp(App):
     def reload_left_panel(self) -> None:
         """Update the tags section in the left panel to show new tags."""
         tags_container = self.query_one("#tags_container", Vertical)
-        all_tags = self.db.get_all_tags()
+        # Always re-read here; this is how the panel picks up tag changes
+        all_tags = self._all_tags = self.db.get_all_tags()
+        self._tag_names = {tag['name'] for tag in all_tags}
         
         # Check if tags_list exists
         existing_tags_list = tags_container.query("#tags_list")
@@ -1982,60 +2060,59 @@ class ArxivReaderApp(App):
             tags_container.mount(Static("Tags", classes="pane_title"), before=0)
         
         if existing_tags_list:
-            # Update existing tags list
+            # Update the existing list in place: drop deleted tags and mount new
+            # ones at their sorted position, leaving unchanged items alone
             tags_list_view = existing_tags_list[0]
-            current_selection_index = tags_list_view.index
-            selected_item_id = None
-            if current_selection_index is not None and current_selection_index < len(tags_list_view.children):
-                selected_item_id = tags_list_view.children[current_selection_index].id
-            
-            # Get current tag items in the list
-            current_tag_ids = set(item.id for item in tags_list_view.children)
-            
-            # Build new tag items
-            new_tag_items = []
-            new_selection_index = None
-            
-            for i, tag in enumerate(all_tags):
-                unread_count = self.db.get_unread_count_by_tag(tag['name'])
-                tag_text = f"{tag['name']} ({unread_count})" if unread_count > 0 else tag['name']
-                sanitized_tag_name = re.sub(r'[^a-zA-Z0-9_-]', '_', tag['name'])
-                item_id = f"tag_{sanitized_tag_name}"
-                
-                if item_id not in current_tag_ids:
-                    # This is a new tag, create the item
-                    tag_item = ListItem(Static(tag_text), id=item_id)
+            selected_item = tags_list_view.highlighted_child if tags_list_view.index is not None else None
+            current_items = {item.id: item for item in tags_list_view.children}
+            tag_item_ids = [f"tag_{sanitize_widget_id(tag['name'])}" for tag in all_tags]
+            wanted_ids = set(tag_item_ids)
+
+            for item_id, item in current_items.items():
+                if item_id not in wanted_ids:
+                    self._menu_labels.pop(item_id, None)
+                    item.remove()
+
+            # Walk backwards so each new item can be mounted before its successor
+            next_item = None
+            unread_counts = None
+            for tag, item_id in reversed(list(zip(all_tags, tag_item_ids))):
+                tag_item = current_items.get(item_id)
+                if tag_item is None:
+                    if unread_counts is None:
+                        unread_counts = self.db.get_unread_counts_by_tag()
+                    unread_count = unread_counts.get(tag['name'], 0)
+                    tag_text = f"{tag['name']} ({unread_count})" if unread_count > 0 else tag['name']
+                    tag_item = self._menu_item(item_id, tag_text)
                     tag_item.original_tag_name = tag['name']
-                    new_tag_items.append(tag_item)
-                
-                if item_id == selected_item_id:
-                    new_selection_index = i
-            
-            # Add new tag items to the list
-            for tag_item in new_tag_items:
-                tags_list_view.mount(tag_item)
-            
-            # Update selection if needed
-            if new_selection_index is not None:
-                tags_list_view.index = new_selection_index
+                    if next_item is None:
+                        tags_list_view.mount(tag_item)
+                    else:
+                        tags_list_view.mount(tag_item, before=next_item)
+                next_item = tag_item
+
+            # Keep the highlight on the same tag; its final position is its sorted one
+            if selected_item is not None and selected_item.id in wanted_ids:
+                tags_list_view.index = tag_item_ids.index(selected_item.id)
         
         else:
             # Create tags list for the first time
             tag_items = []
+            unread_counts = self.db.get_unread_counts_by_tag()
             for tag in all_tags:
-                tag_count = self.db.get_count_by_tag(tag['name'])
+                tag_count = unread_counts.get(tag['name'], 0)
                 tag_text = f"{tag['name']} ({tag_count})" if tag_count > 0 else tag['name']
-                sanitized_tag_name = re.sub(r'[^a-zA-Z0-9_-]', '_', tag['name'])
+                sanitized_tag_name = sanitize_widget_id(tag['name'])
                 
-                tag_item = ListItem(Static(tag_text), id=f"tag_{sanitized_tag_name}")
+                tag_item = self._menu_item(f"tag_{sanitized_tag_name}", tag_text)
                 tag_item.original_tag_name = tag['name']
                 tag_items.append(tag_item)
             
-            new_tags_list = ListView(*tag_items, id="tags_list")
+            new_tags_list = ListView(*tag_items, initial_index=None, id="tags_list")
             tags_container.mount(new_tags_list)
 
         # Refresh all left panel counts since tagging operations could affect various counts
-        self.refresh_left_panel_counts()
+        self._schedule_counts_refresh()
         
         self.notify("Tags updated successfully!", timeout=3)
 
@@ -2043,16 +2120,13 @@ class ArxivReaderApp(App):
 
     def update_header_status(self) -> None:
         """Update the header status with feed and library counts and last refresh time."""
+        header_status = self._header_status
+        if header_status is None:
+            return  # Not mounted yet
         try:
-            header_status = self.query_one("#header_status", Static)
-            
-            # Get retention period from config
-            config = self.config_manager.get_config()
-            retention_days = config.get("feed_retention_days", 30)
-            
-            # Get feed and library counts
-            feed_count = self.db.get_feed_articles_count(retention_days)
-            library_count = self.db.get_saved_articles_count()
+            # Feed and library counts arrive with the left-panel counts, so the
+            # spinner ticks during a refresh do not query the database
+            feed_count, library_count = self._header_counts
             
             status_text = f"Feed: {feed_count} articles  Library: {library_count} articles"
             if self.is_refreshing:
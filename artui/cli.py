@@ -82,6 +82,7 @@ def create_parser() -> argparse.ArgumentParser:
     
     db_subparsers.add_parser("info", help="Show database statistics")
     db_subparsers.add_parser("migrate", help="Migrate from old text files")
+    db_subparsers.add_parser("check-index", help="Check the search index and rebuild it if needed")
     
     # User directory command
     userdir_parser = subparsers.add_parser("userdir", help="User directory management")
@@ -233,6 +234,12 @@ def cmd_db(args) -> int:
             print(f"  Migrated {stats['viewed_migrated']} viewed articles")
             if stats['errors'] > 0:
                 print(f"  {stats['errors']} errors occurred during migration")
+
+        elif args.db_action == "check-index":
+            if db.verify_search_index():
+                print("Search index did not match the articles and was rebuilt.")
+            else:
+                print("Search index is up to date.")
                 
         else:
             print("No database action specified. Use --help for options.")
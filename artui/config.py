@@ -1,12 +1,19 @@
 """Configuration management for ArTui."""
 
 import copy
+import glob
+import hashlib
+import json
 import os
+import tempfile
 import yaml
 from typing import Dict, Any, Optional
 from pathlib import Path
 from .user_dirs import get_user_dirs
 
+# libyaml's C parser when PyYAML was built with it; same results, much faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigManager:
     """Manages configuration loading and default values for ArTui."""
@@ -48,6 +55,9 @@ class ConfigManager:
         "keyboard_shortcuts": DEFAULT_KEYBOARD_SHORTCUTS,
     }
 
+    # Parsed configs kept in the cache directory, keyed by file content hash
+    CONFIG_CACHE_MAX_ENTRIES = 16
+
     @staticmethod
     def _warn_config(message: str) -> None:
         """Emit a lightweight warning for non-fatal config issues."""
@@ -97,16 +107,15 @@ class ConfigManager:
             return self._config
             
         try:
-            with open(self.config_path, "r") as f:
-                loaded = yaml.safe_load(f)
-                if loaded is None:
-                    loaded = {}
-                elif not isinstance(loaded, dict):
-                    self._warn_config(
-                        f"expected a mapping at config root, got {type(loaded).__name__}; using defaults"
-                    )
-                    loaded = {}
-                self._config = loaded
+            loaded = self._read_config_file()
+            if loaded is None:
+                loaded = {}
+            elif not isinstance(loaded, dict):
+                self._warn_config(
+                    f"expected a mapping at config root, got {type(loaded).__name__}; using defaults"
+                )
+                loaded = {}
+            self._config = loaded
         except FileNotFoundError:
             self._config = {}
             self.is_first_run = True
@@ -121,6 +130,60 @@ class ConfigManager:
         
         return self._config
 
+    def _read_config_file(self) -> Any:
+        """Parse the config file, reusing a cached parse of identical file contents."""
+        with open(self.config_path, "rb") as f:
+            data = f.read()
+
+        digest = hashlib.sha256(data).hexdigest()
+        cache_path = os.path.join(self.user_dirs.cache_dir, f"config-{digest}.json")
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            pass  # Missing or unreadable cache entry; parse the YAML instead
+
+        loaded = yaml.load(data, Loader=_YAML_LOADER)
+        self._write_config_cache(cache_path, loaded)
+        return loaded
+
+    def _write_config_cache(self, cache_path: str, loaded: Any) -> None:
+        """Atomically store a parsed config as JSON and drop the oldest cache entries.
+
+        Configs that JSON cannot represent exactly (e.g. YAML dates or
+        non-string keys) are not cached.
+        """
+        try:
+            encoded = json.dumps(loaded)
+        except (TypeError, ValueError):
+            return
+        if json.loads(encoded) != loaded:
+            return
+
+        cache_dir = os.path.dirname(cache_path)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(encoded)
+                os.replace(tmp_path, cache_path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+
+            entries = sorted(
+                glob.glob(os.path.join(cache_dir, "config-*.json")),
+                key=os.path.getmtime,
+                reverse=True,
+            )
+            # Entries written by older versions are never read again
+            stale_paths = entries[self.CONFIG_CACHE_MAX_ENTRIES:]
+            stale_paths += glob.glob(os.path.join(cache_dir, "config-*.pkl"))
+            for stale_path in stale_paths:
+                os.unlink(stale_path)
+        except OSError:
+            pass  # The cache is only an optimization
+
     def _normalize_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize config values into safe runtime shapes."""
         default_retention_days = self.DEFAULT_CONFIG["feed_retention_days"]
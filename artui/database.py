@@ -3,14 +3,45 @@
 import os
 import sqlite3
 import json
+import itertools
+import threading
+import time
 from datetime import datetime
-from typing import List, Dict, Optional, Set
-import arxiv
+from typing import TYPE_CHECKING, List, Dict, Optional, Set, Tuple
 from .user_dirs import get_user_dirs
 
+if TYPE_CHECKING:
+    import arxiv
+
+
+# Article columns loaded for result lists; the summary is fetched per article
+# when it is displayed (see get_article_summary)
+_ARTICLE_LIST_COLUMNS = (
+    "a.id, a.entry_id, a.title, a.authors, a.categories, "
+    "a.published_date, a.pdf_url, a.notes_file_path"
+)
+
+
+class _ChangeTrackingConnection(sqlite3.Connection):
+    """Connection that reports ``with`` blocks which modified the database."""
+
+    on_change = None  # Callback, set by ArticleDatabase
+    _reported_changes = 0
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        result = super().__exit__(exc_type, exc_value, traceback)
+        if self.total_changes != self._reported_changes:
+            self._reported_changes = self.total_changes
+            if self.on_change is not None:
+                self.on_change()
+        return result
+
 
 class ArticleDatabase:
     """Database manager for ArXiv articles with SQLite backend."""
+
+    # Category views are served from memory for this long unless data changes
+    QUERY_CACHE_TTL_SECONDS = 60
     
     def __init__(self, db_path: Optional[str] = None, custom_user_dir: Optional[str] = None):
         # Initialize user directories
@@ -21,18 +52,61 @@ class ArticleDatabase:
             self.db_path = self.user_dirs.database_file
         else:
             self.db_path = db_path
+
+        # One connection per thread, reused across calls
+        self._local = threading.local()
+
+        # Cached query results, valid while no connection has written since
+        self._query_cache: Dict[tuple, Tuple[int, float, List[sqlite3.Row]]] = {}
+        self._generations = itertools.count(1)
+        self._data_generation = 0
             
         self.init_database()
     
     def get_connection(self) -> sqlite3.Connection:
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get this thread's database connection with row factory.
+
+        The connection is opened on first use and then reused, so its page
+        cache and prepared statements survive between calls. Use it as a
+        context manager to commit or roll back.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path, cached_statements=256, factory=_ChangeTrackingConnection
+            )
+            conn.row_factory = sqlite3.Row
+            conn.on_change = self._note_data_change
+            # Per-connection settings; safe with WAL and much cheaper than full fsyncs
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA cache_size = -20000")  # ~20 MB page cache
+            conn.execute("PRAGMA mmap_size = 268435456")  # read pages straight from the OS cache
+            self._local.conn = conn
         return conn
     
+    def _note_data_change(self) -> None:
+        """Invalidate cached query results after a write."""
+        self._data_generation = next(self._generations)
+
+    def _cached_rows(self, key: tuple, fetch) -> List[sqlite3.Row]:
+        """Return ``fetch()`` rows, reusing a recent result if nothing was written since."""
+        generation = self._data_generation
+        now = time.monotonic()
+        entry = self._query_cache.get(key)
+        if entry is not None and entry[0] == generation and now - entry[1] < self.QUERY_CACHE_TTL_SECONDS:
+            return list(entry[2])
+        rows = fetch()
+        self._query_cache[key] = (generation, now, rows)
+        return list(rows)
+    
     def init_database(self) -> None:
         """Initialize database tables."""
         with self.get_connection() as conn:
+            # WAL lets the UI read while a refresh worker writes; the mode is
+            # stored in the database file, so setting it once is enough
+            conn.execute("PRAGMA journal_mode = WAL")
+
             # Articles table - stores all article metadata
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS articles (
@@ -70,7 +144,9 @@ class ArticleDatabase:
                     category_code TEXT PRIMARY KEY,
                     category_name TEXT NOT NULL,
                     last_fetched TEXT NOT NULL,    -- ISO datetime of last fetch
-                    article_count INTEGER DEFAULT 0
+                    article_count INTEGER DEFAULT 0,
+                    fetch_query TEXT,              -- arXiv query of the last recent fetch
+                    fetch_days INTEGER             -- Window (days) of the last recent fetch
                 )
             """)
             
@@ -95,10 +171,26 @@ class ArticleDatabase:
                 )
             """)
             
-
+            # Inspire-HEP citation lookups, cached so repeat lookups skip the network
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS inspire_citations (
+                    base_article_id TEXT PRIMARY KEY,   -- arXiv ID without version
+                    inspire_id INTEGER NOT NULL,
+                    bibtex TEXT NOT NULL,
+                    n_citations INTEGER NOT NULL,
+                    reference_ids TEXT NOT NULL,        -- JSON array of Inspire record IDs
+                    fetched_at REAL NOT NULL            -- Unix time of the lookup
+                )
+            """)
             
             # Create indexes for performance
             self._create_indexes(conn)
+
+            # Category lookup table derived from the JSON categories column
+            self._create_category_index(conn)
+
+            # Full-text index used by text searches
+            self._fts_enabled = self._create_search_index(conn)
             
             # Run database migrations
             self._migrate_database()
@@ -110,15 +202,170 @@ class ArticleDatabase:
             "CREATE INDEX IF NOT EXISTS idx_articles_categories ON articles (categories)",
             "CREATE INDEX IF NOT EXISTS idx_status_saved ON article_status (is_saved)",
             "CREATE INDEX IF NOT EXISTS idx_status_viewed ON article_status (is_viewed)",
+            # Partial index for the Library views: saved rows ordered by saved_at
+            "CREATE INDEX IF NOT EXISTS idx_status_saved_at ON article_status (saved_at, is_viewed) WHERE is_saved = 1",
             "CREATE INDEX IF NOT EXISTS idx_tags_name ON tags (name)",
             "CREATE INDEX IF NOT EXISTS idx_article_tags_article ON article_tags (article_id)",
-            "CREATE INDEX IF NOT EXISTS idx_article_tags_tag ON article_tags (tag_id)",
-
+            # Covering index for tag views and counts (tag -> article ids)
+            "CREATE INDEX IF NOT EXISTS idx_article_tags_tag_article ON article_tags (tag_id, article_id)",
+            "DROP INDEX IF EXISTS idx_article_tags_tag",
         ]
         
         for index_sql in indexes:
             conn.execute(index_sql)
     
+    def _create_category_index(self, conn: sqlite3.Connection) -> None:
+        """Create the article_categories table that mirrors articles.categories.
+
+        Category filters join this indexed table instead of expanding the JSON
+        categories of every article with json_each().
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'article_categories'"
+        ).fetchone() is not None
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS article_categories (
+                category TEXT NOT NULL,
+                article_id TEXT NOT NULL,
+                PRIMARY KEY (category, article_id)
+            ) WITHOUT ROWID
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_article_categories_article ON article_categories (article_id)"
+        )
+
+        # Keep the table in sync with the articles table
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS article_categories_insert AFTER INSERT ON articles BEGIN
+                INSERT OR IGNORE INTO article_categories (category, article_id)
+                SELECT value, new.id FROM json_each(new.categories);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS article_categories_delete AFTER DELETE ON articles BEGIN
+                DELETE FROM article_categories WHERE article_id = old.id;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS article_categories_update AFTER UPDATE OF id, categories ON articles BEGIN
+                DELETE FROM article_categories WHERE article_id = old.id;
+                INSERT OR IGNORE INTO article_categories (category, article_id)
+                SELECT value, new.id FROM json_each(new.categories);
+            END
+        """)
+
+        if not exists:
+            # Fill in articles stored before the table existed
+            conn.execute("""
+                INSERT OR IGNORE INTO article_categories (category, article_id)
+                SELECT json_each.value, a.id FROM articles a, json_each(a.categories)
+            """)
+
+    def _get_category_filter(self, categories: List[str]) -> Tuple[str, List[str]]:
+        """Get SQL condition and parameters matching articles in any of the categories."""
+        placeholders = ",".join("?" * len(categories))
+        return (
+            f"a.id IN (SELECT article_id FROM article_categories WHERE category IN ({placeholders}))",
+            list(categories),
+        )
+
+    def _create_search_index(self, conn: sqlite3.Connection) -> bool:
+        """Create the FTS5 search index over articles. Returns False if unsupported.
+
+        The trigram tokenizer keeps the case-insensitive substring semantics of the
+        previous LIKE '%query%' searches while answering them from an index.
+
+        The index is keyed on articles.search_rowid, a number assigned once per
+        article. The implicit rowid of articles cannot be used: its primary key is
+        the TEXT id, so VACUUM or other tools may renumber rowids.
+        """
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+        ).fetchone()
+        if row is not None and "content_rowid='search_rowid'" not in row['sql']:
+            # Index from older versions, keyed on the implicit rowid
+            for name in ("articles_fts_insert", "articles_fts_delete", "articles_fts_update"):
+                conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            conn.execute("DROP TABLE articles_fts")
+            row = None
+        exists = row is not None
+
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                    title, authors, summary,
+                    content='articles', content_rowid='search_rowid', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5 or older than 3.34 (no trigram tokenizer)
+            return False
+
+        columns = [col[1] for col in conn.execute("PRAGMA table_info(articles)")]
+        if 'search_rowid' not in columns:
+            conn.execute("ALTER TABLE articles ADD COLUMN search_rowid INTEGER")
+            conn.execute("UPDATE articles SET search_rowid = rowid")
+        conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_search_rowid ON articles (search_rowid)"
+        )
+
+        # Number new articles and keep the external-content index in sync
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+                UPDATE articles
+                SET search_rowid = (SELECT COALESCE(MAX(search_rowid), 0) + 1 FROM articles)
+                WHERE rowid = new.rowid AND new.search_rowid IS NULL;
+                INSERT INTO articles_fts (rowid, title, authors, summary)
+                SELECT search_rowid, title, authors, summary FROM articles WHERE rowid = new.rowid;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, authors, summary)
+                VALUES ('delete', old.search_rowid, old.title, old.authors, old.summary);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title, authors, summary ON articles BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, authors, summary)
+                VALUES ('delete', old.search_rowid, old.title, old.authors, old.summary);
+                INSERT INTO articles_fts (rowid, title, authors, summary)
+                VALUES (new.search_rowid, new.title, new.authors, new.summary);
+            END
+        """)
+
+        if not exists:
+            # Index articles stored before the search index existed
+            conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+        return True
+
+    def verify_search_index(self) -> bool:
+        """Check the search index against the articles table and rebuild it if they differ.
+
+        Returns True if the index had to be rebuilt. The check reads the whole
+        index inside a write transaction, so other writers wait until it is done;
+        it is only run on request (``artui db check-index``).
+        """
+        if not self._fts_enabled:
+            return False
+        with self.get_connection() as conn:
+            try:
+                # rank = 1 also compares the index with the external content table
+                conn.execute("INSERT INTO articles_fts (articles_fts, rank) VALUES ('integrity-check', 1)")
+                return False
+            except sqlite3.DatabaseError:
+                conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+                return True
+
+    def _get_text_search_filter(self, query: str) -> Tuple[str, List[str]]:
+        """Get SQL condition and parameters matching query in title, authors or summary."""
+        # Trigram matching needs at least three characters; shorter queries use LIKE
+        if self._fts_enabled and len(query) >= 3:
+            phrase = '"' + query.replace('"', '""') + '"'
+            return "a.search_rowid IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)", [phrase]
+        search_term = f"%{query}%"
+        return "(a.title LIKE ? OR a.authors LIKE ? OR a.summary LIKE ?)", [search_term] * 3
+
     def _migrate_database(self) -> None:
         """Run database migrations for schema updates."""
         with self.get_connection() as conn:
@@ -134,6 +381,15 @@ class ArticleDatabase:
 
             if 'notes_file_path' not in columns:
                 conn.execute("ALTER TABLE articles ADD COLUMN notes_file_path TEXT")
+
+            cursor = conn.execute("PRAGMA table_info(fetched_categories)")
+            columns = [col[1] for col in cursor.fetchall()]
+
+            if 'fetch_query' not in columns:
+                conn.execute("ALTER TABLE fetched_categories ADD COLUMN fetch_query TEXT")
+
+            if 'fetch_days' not in columns:
+                conn.execute("ALTER TABLE fetched_categories ADD COLUMN fetch_days INTEGER")
     
     def article_exists(self, article_id: str) -> bool:
         """Check if article already exists in database."""
@@ -141,61 +397,71 @@ class ArticleDatabase:
             cursor = conn.execute("SELECT 1 FROM articles WHERE id = ?", (article_id,))
             return cursor.fetchone() is not None
     
-    def add_article(self, article: arxiv.Result) -> bool:
+    def add_article(self, article: "arxiv.Result") -> bool:
         """Add article to database if it doesn't exist. Returns True if added."""
+        with self.get_connection() as conn:
+            return self._insert_article(conn, article)
+    
+    def _insert_article(self, conn: sqlite3.Connection, article: "arxiv.Result") -> bool:
+        """Insert an article and its status row unless it exists; part of the caller's transaction."""
         article_id = article.get_short_id()
-        
-        if self.article_exists(article_id):
+        if conn.execute("SELECT 1 FROM articles WHERE id = ?", (article_id,)).fetchone() is not None:
             return False
         
         authors = json.dumps([author.name for author in article.authors])
         categories = json.dumps(article.categories)
         now = datetime.now().isoformat()
         
-        with self.get_connection() as conn:
-            conn.execute("""
-                INSERT INTO articles (
-                    id, entry_id, title, authors, summary, categories,
-                    published_date, pdf_url, citation_count, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                article_id,
-                article.entry_id,
-                article.title,
-                authors,
-                article.summary,
-                categories,
-                article.published.isoformat(),
-                article.pdf_url,
-                0,  # Initialize citation count to 0
-                now,
-                now
-            ))
-            
-            # Initialize article status
-            conn.execute("""
-                INSERT INTO article_status (article_id, is_saved, is_viewed)
-                VALUES (?, 0, 0)
-            """, (article_id,))
+        conn.execute("""
+            INSERT INTO articles (
+                id, entry_id, title, authors, summary, categories,
+                published_date, pdf_url, citation_count, created_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            article_id,
+            article.entry_id,
+            article.title,
+            authors,
+            article.summary,
+            categories,
+            article.published.isoformat(),
+            article.pdf_url,
+            0,  # Initialize citation count to 0
+            now,
+            now
+        ))
         
+        # Initialize article status
+        conn.execute("""
+            INSERT INTO article_status (article_id, is_saved, is_viewed)
+            VALUES (?, 0, 0)
+        """, (article_id,))
         return True
     
-    def add_articles_batch(self, articles: List[arxiv.Result]) -> int:
+    def add_articles_batch(self, articles: List["arxiv.Result"]) -> int:
         """Add multiple articles in batch. Returns number of new articles added."""
         added_count = 0
         
+        # Keep the first copy of articles that appear twice in the batch
+        new_articles = {}
+        for article in articles:
+            new_articles.setdefault(article.get_short_id(), article)
+        if not new_articles:
+            return 0
+        
         with self.get_connection() as conn:
-            for article in articles:
-                article_id = article.get_short_id()
-                
-                # Check if exists
-                cursor = conn.execute("SELECT 1 FROM articles WHERE id = ?", (article_id,))
-                if cursor.fetchone() is not None:
-                    continue
-                
+            # Look up which articles exist with one query instead of one per article
+            cursor = conn.execute(
+                "SELECT id FROM articles WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps(list(new_articles)),)
+            )
+            for row in cursor.fetchall():
+                del new_articles[row['id']]
+            
+            now = datetime.now().isoformat()
+            for article_id, article in new_articles.items():
                 authors = json.dumps([author.name for author in article.authors])
                 categories = json.dumps(article.categories)
-                now = datetime.now().isoformat()
                 
                 try:
                     conn.execute("""
@@ -228,66 +494,75 @@ class ArticleDatabase:
                 except sqlite3.IntegrityError:
                     # Handle race conditions
                     continue
+
+            if added_count:
+                # Refresh planner statistics after bulk inserts (cheap when nothing changed)
+                conn.execute("PRAGMA optimize")
         
         return added_count
     
-    def get_articles_by_category(self, category: str, feed_retention_days: Optional[int] = None) -> List[Dict]:
+    def get_articles_by_category(self, category: str, feed_retention_days: Optional[int] = None) -> List[sqlite3.Row]:
         """Get articles by category with status information, optionally filtered by feed retention."""
+        return self.get_articles_by_categories([category], feed_retention_days)
+    
+    def get_articles_by_categories(self, categories: List[str], feed_retention_days: Optional[int] = None) -> List[sqlite3.Row]:
+        """Get articles in any of the given categories, each article once, newest first."""
+        if not categories:
+            return []
+        return self._cached_rows(
+            ("categories", tuple(categories), feed_retention_days),
+            lambda: self._query_articles_by_categories(categories, feed_retention_days),
+        )
+
+    def _query_articles_by_categories(self, categories: List[str], feed_retention_days: Optional[int]) -> List[sqlite3.Row]:
+        """Run the category view query; see get_articles_by_categories."""
         with self.get_connection() as conn:
+            category_filter, params = self._get_category_filter(categories)
             retention_filter = self._get_feed_retention_filter(feed_retention_days)
             cursor = conn.execute(f"""
-                SELECT a.*, s.is_saved, s.is_viewed, s.saved_at, s.viewed_at,
+                SELECT {_ARTICLE_LIST_COLUMNS}, s.is_saved, s.is_viewed, s.saved_at, s.viewed_at,
                        CASE WHEN at.article_id IS NOT NULL THEN 1 ELSE 0 END as has_tags
 
                 FROM articles a
                 LEFT JOIN article_status s ON a.id = s.article_id
                 LEFT JOIN (SELECT DISTINCT article_id FROM article_tags) at ON a.id = at.article_id
 
-                WHERE EXISTS (
-                    SELECT 1 FROM json_each(a.categories) 
-                    WHERE json_each.value = ?
-                ) AND {retention_filter}
+                WHERE {category_filter} AND {retention_filter}
                 ORDER BY a.published_date DESC
-            """, (category,))
+            """, params)
             
-            return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
     
-    def search_articles(self, query: str, feed_retention_days: Optional[int] = None) -> List[Dict]:
+    def search_articles(self, query: str, feed_retention_days: Optional[int] = None) -> List[sqlite3.Row]:
         """Search articles by title, authors, or summary, optionally filtered by feed retention."""
         with self.get_connection() as conn:
-            search_term = f"%{query}%"
+            text_filter, params = self._get_text_search_filter(query)
             retention_filter = self._get_feed_retention_filter(feed_retention_days)
             cursor = conn.execute(f"""
-                SELECT a.*, s.is_saved, s.is_viewed, s.saved_at, s.viewed_at,
+                SELECT {_ARTICLE_LIST_COLUMNS}, s.is_saved, s.is_viewed, s.saved_at, s.viewed_at,
                        CASE WHEN at.article_id IS NOT NULL THEN 1 ELSE 0 END as has_tags
 
                 FROM articles a
                 LEFT JOIN article_status s ON a.id = s.article_id
                 LEFT JOIN (SELECT DISTINCT article_id FROM article_tags) at ON a.id = at.article_id
 
-                WHERE (a.title LIKE ? OR a.authors LIKE ? OR a.summary LIKE ?)
+                WHERE {text_filter}
                   AND {retention_filter}
                 ORDER BY a.published_date DESC
-            """, (search_term, search_term, search_term))
+            """, params)
             
-            return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
     
-    def search_articles_in_categories(self, query: str, categories: List[str], feed_retention_days: Optional[int] = None) -> List[Dict]:
+    def search_articles_in_categories(self, query: str, categories: List[str], feed_retention_days: Optional[int] = None) -> List[sqlite3.Row]:
         """Search articles by title, authors, or summary, restricted to given categories, optionally filtered by feed retention."""
         if not categories:
             return self.search_articles(query, feed_retention_days)
         with self.get_connection() as conn:
-            search_term = f"%{query}%"
+            text_filter, text_params = self._get_text_search_filter(query)
             retention_filter = self._get_feed_retention_filter(feed_retention_days)
-            # Build category conditions using JSON functions
-            category_conditions = []
-            params = []
-            for cat in categories:
-                category_conditions.append("EXISTS (SELECT 1 FROM json_each(a.categories) WHERE json_each.value = ?)")
-                params.append(cat)
-            category_clause = " OR ".join(category_conditions)
+            category_clause, params = self._get_category_filter(categories)
             sql = f'''
-                SELECT a.*, s.is_saved, s.is_viewed, s.saved_at, s.viewed_at,
+                SELECT {_ARTICLE_LIST_COLUMNS}, s.is_saved, s.is_viewed, s.saved_at, s.viewed_at,
                        CASE WHEN at.article_id IS NOT NULL THEN 1 ELSE 0 END as has_tags
 
                 FROM articles a
@@ -295,19 +570,29 @@ class ArticleDatabase:
                 LEFT JOIN (SELECT DISTINCT article_id FROM article_tags) at ON a.id = at.article_id
 
                 WHERE ({category_clause})
-                  AND (a.title LIKE ? OR a.authors LIKE ? OR a.summary LIKE ?)
+                  AND {text_filter}
                   AND {retention_filter}
                 ORDER BY a.published_date DESC
             '''
-            params += [search_term, search_term, search_term]
+            params += text_params
             cursor = conn.execute(sql, params)
-            return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
     
-    def get_saved_articles(self) -> List[Dict]:
-        """Get all saved articles."""
+    def get_article_summary(self, article_id: str) -> str:
+        """Get the abstract of an article, or an empty string if it is unknown."""
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT a.*, s.is_saved, s.is_viewed, s.saved_at, s.viewed_at,
+            row = conn.execute("SELECT summary FROM articles WHERE id = ?", (article_id,)).fetchone()
+            return row['summary'] if row else ""
+    
+    def get_saved_articles(self, query: Optional[str] = None) -> List[sqlite3.Row]:
+        """Get all saved articles, optionally matching a search query."""
+        with self.get_connection() as conn:
+            if query:
+                text_filter, params = self._get_text_search_filter(query)
+            else:
+                text_filter, params = "1=1", []
+            cursor = conn.execute(f"""
+                SELECT {_ARTICLE_LIST_COLUMNS}, s.is_saved, s.is_viewed, s.saved_at, s.viewed_at,
                        CASE WHEN at.article_id IS NOT NULL THEN 1 ELSE 0 END as has_tags
 
                 FROM articles a
@@ -315,34 +600,40 @@ class ArticleDatabase:
                 LEFT JOIN (SELECT DISTINCT article_id FROM article_tags) at ON a.id = at.article_id
 
                 WHERE s.is_saved = 1
+                  AND {text_filter}
                 ORDER BY s.saved_at DESC
-            """)
+            """, params)
             
-            return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
     
-    def get_unread_articles(self) -> List[Dict]:
-        """Get all unread articles."""
+    def get_unread_articles(self, query: Optional[str] = None) -> List[sqlite3.Row]:
+        """Get all unread articles, optionally matching a search query."""
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT a.*, s.is_saved, s.is_viewed, s.saved_at, s.viewed_at,
+            if query:
+                text_filter, params = self._get_text_search_filter(query)
+            else:
+                text_filter, params = "1=1", []
+            cursor = conn.execute(f"""
+                SELECT {_ARTICLE_LIST_COLUMNS}, s.is_saved, s.is_viewed, s.saved_at, s.viewed_at,
                        CASE WHEN at.article_id IS NOT NULL THEN 1 ELSE 0 END as has_tags
 
                 FROM articles a
                 LEFT JOIN article_status s ON a.id = s.article_id
                 LEFT JOIN (SELECT DISTINCT article_id FROM article_tags) at ON a.id = at.article_id
 
-                WHERE s.is_viewed IS NULL OR s.is_viewed = 0
+                WHERE (s.is_viewed IS NULL OR s.is_viewed = 0)
+                  AND {text_filter}
                 ORDER BY a.published_date DESC
-            """)
+            """, params)
             
-            return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
     
-    def get_all_articles(self, feed_retention_days: Optional[int] = None) -> List[Dict]:
+    def get_all_articles(self, feed_retention_days: Optional[int] = None) -> List[sqlite3.Row]:
         """Get all articles from database, optionally filtered by feed retention."""        
         with self.get_connection() as conn:
             retention_filter = self._get_feed_retention_filter(feed_retention_days)
             cursor = conn.execute(f"""
-                SELECT a.*, 
+                SELECT {_ARTICLE_LIST_COLUMNS}, 
                        COALESCE(s.is_saved, 0) as is_saved, 
                        COALESCE(s.is_viewed, 0) as is_viewed, 
                        s.saved_at, s.viewed_at,
@@ -354,13 +645,17 @@ class ArticleDatabase:
                 ORDER BY a.published_date DESC
             """)
             
-            return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
     
-    def get_articles_with_notes(self) -> List[Dict]:
-        """Get all articles that have notes."""
+    def get_articles_with_notes(self, query: Optional[str] = None) -> List[sqlite3.Row]:
+        """Get all articles that have notes, optionally matching a search query."""
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT a.*, s.is_saved, s.is_viewed, s.saved_at, s.viewed_at,
+            if query:
+                text_filter, params = self._get_text_search_filter(query)
+            else:
+                text_filter, params = "1=1", []
+            cursor = conn.execute(f"""
+                SELECT {_ARTICLE_LIST_COLUMNS}, s.is_saved, s.is_viewed, s.saved_at, s.viewed_at,
                        CASE WHEN at.article_id IS NOT NULL THEN 1 ELSE 0 END as has_tags
 
                 FROM articles a
@@ -368,10 +663,11 @@ class ArticleDatabase:
                 LEFT JOIN (SELECT DISTINCT article_id FROM article_tags) at ON a.id = at.article_id
 
                 WHERE a.notes_file_path IS NOT NULL
+                  AND {text_filter}
                 ORDER BY a.published_date DESC
-            """)
+            """, params)
             
-            return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
     
     def _get_feed_retention_filter(self, retention_days: Optional[int]) -> str:
         """Get SQL condition for feed retention filtering."""
@@ -398,6 +694,18 @@ class ArticleDatabase:
                 WHERE article_id = ? AND is_viewed = 0
             """, (now, article_id))
     
+    def mark_articles_viewed(self, article_ids: List[str]) -> int:
+        """Mark several articles as viewed in one transaction. Returns the number changed."""
+        now = datetime.now().isoformat()
+        with self.get_connection() as conn:
+            cursor = conn.executemany("""
+                UPDATE article_status 
+                SET is_viewed = 1, viewed_at = ?
+                WHERE article_id = ? AND is_viewed = 0
+            """, [(now, article_id) for article_id in article_ids])
+            
+            return cursor.rowcount
+    
     def mark_article_saved(self, article_id: str) -> bool:
         """Mark article as saved. Returns True if status changed."""
         now = datetime.now().isoformat()
@@ -427,6 +735,39 @@ class ArticleDatabase:
             """, (now, article_id))
             return True
     
+    def save_article(self, article_id: str, article: Optional["arxiv.Result"] = None) -> bool:
+        """Mark article as saved and viewed in one transaction. Returns True if saved status changed.
+        
+        If ``article`` is given it is added to the database first when missing,
+        e.g. for global search results.
+        """
+        now = datetime.now().isoformat()
+        with self.get_connection() as conn:
+            if article is not None:
+                self._insert_article(conn, article)
+            
+            row = conn.execute("""
+                SELECT is_saved FROM article_status WHERE article_id = ?
+            """, (article_id,)).fetchone()
+            if row is None:
+                conn.execute("""
+                    INSERT INTO article_status (article_id, is_saved, is_viewed, saved_at, viewed_at)
+                    VALUES (?, 1, 1, ?, ?)
+                """, (article_id, now, now))
+                return True
+            
+            if row['is_saved'] == 1:
+                return False  # Already saved
+            
+            conn.execute("""
+                UPDATE article_status 
+                SET is_saved = 1, saved_at = ?,
+                    viewed_at = CASE WHEN is_viewed = 1 THEN viewed_at ELSE ? END,
+                    is_viewed = 1
+                WHERE article_id = ?
+            """, (now, now, article_id))
+            return True
+    
     def mark_article_unsaved(self, article_id: str) -> bool:
         """Remove saved status from article. Returns True if status changed."""
         with self.get_connection() as conn:
@@ -521,73 +862,110 @@ class ArticleDatabase:
         """Get count of unread articles for a specific category, optionally filtered by feed retention."""
         with self.get_connection() as conn:
             retention_filter = self._get_feed_retention_filter(feed_retention_days)
+            category_filter, params = self._get_category_filter([category])
             cursor = conn.execute(f"""
                 SELECT COUNT(*) as count
                 FROM articles a
                 LEFT JOIN article_status s ON a.id = s.article_id
-                WHERE EXISTS (
-                    SELECT 1 FROM json_each(a.categories) 
-                    WHERE json_each.value = ?
-                ) AND (s.is_viewed IS NULL OR s.is_viewed = 0)
+                WHERE {category_filter}
+                  AND (s.is_viewed IS NULL OR s.is_viewed = 0)
                   AND {retention_filter}
-            """, (category,))
+            """, params)
             return cursor.fetchone()['count']
     
+    def _get_filter_condition(self, filter_config: Dict) -> Optional[Tuple[str, List[str]]]:
+        """Get SQL condition and parameters for a configured filter, or None if it matches nothing."""
+        conditions = []
+        params = []
+        if filter_config.get("categories"):
+            category_clause, category_params = self._get_category_filter(filter_config["categories"])
+            conditions.append(f"({category_clause})")
+            params += category_params
+        if filter_config.get("query"):
+            # Same matching as the filter's article view, served by the search index
+            text_clause, text_params = self._get_text_search_filter(filter_config["query"])
+            conditions.append(text_clause)
+            params += text_params
+        if not conditions:
+            return None
+        return " AND ".join(conditions), params
+
     def get_unread_count_by_filter(self, filter_config: Dict, feed_retention_days: Optional[int] = None) -> int:
         """Get count of unread articles for a filter configuration, optionally filtered by feed retention."""
         if not filter_config:
             return 0
+        filter_condition = self._get_filter_condition(filter_config)
+        if filter_condition is None:
+            return 0
+        filter_clause, params = filter_condition
             
         with self.get_connection() as conn:
             retention_filter = self._get_feed_retention_filter(feed_retention_days)
-            # If filter has categories specified
-            if filter_config.get("categories"):
-                category_conditions = []
-                params = []
-                
-                for cat in filter_config["categories"]:
-                    category_conditions.append("EXISTS (SELECT 1 FROM json_each(a.categories) WHERE json_each.value = ?)")
-                    params.append(cat)
-                
-                category_clause = " OR ".join(category_conditions)
-                
-                # If filter also has a query, combine with search
-                if filter_config.get("query"):
-                    query = filter_config["query"].lower()
-                    cursor = conn.execute(f"""
-                        SELECT COUNT(*) as count
-                        FROM articles a
-                        LEFT JOIN article_status s ON a.id = s.article_id
-                        WHERE ({category_clause})
-                        AND (LOWER(a.title) LIKE ? OR LOWER(a.authors) LIKE ? OR LOWER(a.summary) LIKE ?)
-                        AND (s.is_viewed IS NULL OR s.is_viewed = 0)
-                        AND {retention_filter}
-                    """, params + [f'%{query}%', f'%{query}%', f'%{query}%'])
-                else:
-                    cursor = conn.execute(f"""
-                        SELECT COUNT(*) as count
-                        FROM articles a
-                        LEFT JOIN article_status s ON a.id = s.article_id
-                        WHERE ({category_clause})
-                        AND (s.is_viewed IS NULL OR s.is_viewed = 0)
-                        AND {retention_filter}
-                    """, params)
-                    
-            # If filter only has query (no categories)
-            elif filter_config.get("query"):
-                query = filter_config["query"].lower()
-                cursor = conn.execute(f"""
-                    SELECT COUNT(*) as count
-                    FROM articles a
-                    LEFT JOIN article_status s ON a.id = s.article_id
-                    WHERE (LOWER(a.title) LIKE ? OR LOWER(a.authors) LIKE ? OR LOWER(a.summary) LIKE ?)
-                    AND (s.is_viewed IS NULL OR s.is_viewed = 0)
-                    AND {retention_filter}
-                """, (f'%{query}%', f'%{query}%', f'%{query}%'))
-            else:
-                return 0
-                
+            cursor = conn.execute(f"""
+                SELECT COUNT(*) as count
+                FROM articles a
+                LEFT JOIN article_status s ON a.id = s.article_id
+                WHERE {filter_clause}
+                AND (s.is_viewed IS NULL OR s.is_viewed = 0)
+                AND {retention_filter}
+            """, params)
             return cursor.fetchone()['count']
+
+    def get_left_panel_counts(self, filters: Dict[str, Dict], categories: List[str],
+                              feed_retention_days: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        """Get all counts shown in the left panel with a single query.
+
+        Returns a dict with the keys "totals" (unread/saved/notes/feed), "filters"
+        (by filter name), "categories" (by category code) and "tags" (every
+        tag by name). Unread counts for categories and filters honour feed
+        retention; names with no unread articles may be missing.
+        """
+        retention_filter = self._get_feed_retention_filter(feed_retention_days)
+        unread = "(s.is_viewed IS NULL OR s.is_viewed = 0)"
+        parts = [
+            f"""SELECT 'totals' AS kind, 'unread' AS name, COUNT(*) AS count
+                FROM articles a LEFT JOIN article_status s ON a.id = s.article_id
+                WHERE {unread}""",
+            """SELECT 'totals', 'saved', COUNT(*) FROM article_status WHERE is_saved = 1""",
+            """SELECT 'totals', 'notes', COUNT(*) FROM articles WHERE notes_file_path IS NOT NULL""",
+            f"""SELECT 'totals', 'feed', COUNT(*)
+                FROM articles a LEFT JOIN article_status s ON a.id = s.article_id
+                WHERE {retention_filter}""",
+            # Every tag is listed, including those without unread articles
+            f"""SELECT 'tags', t.name, SUM(a.id IS NOT NULL AND {unread})
+                FROM tags t
+                LEFT JOIN article_tags at ON t.id = at.tag_id
+                LEFT JOIN articles a ON a.id = at.article_id
+                LEFT JOIN article_status s ON a.id = s.article_id
+                GROUP BY t.name""",
+        ]
+        params: List[str] = []
+
+        if categories:
+            placeholders = ",".join("?" * len(categories))
+            parts.append(f"""SELECT 'categories', ac.category, COUNT(*)
+                FROM article_categories ac
+                INNER JOIN articles a ON a.id = ac.article_id
+                LEFT JOIN article_status s ON a.id = s.article_id
+                WHERE ac.category IN ({placeholders}) AND {unread} AND {retention_filter}
+                GROUP BY ac.category""")
+            params += list(categories)
+
+        for name, filter_config in filters.items():
+            filter_condition = self._get_filter_condition(filter_config or {})
+            if filter_condition is None:
+                continue
+            filter_clause, filter_params = filter_condition
+            parts.append(f"""SELECT 'filters', ?, COUNT(*)
+                FROM articles a LEFT JOIN article_status s ON a.id = s.article_id
+                WHERE {filter_clause} AND {unread} AND {retention_filter}""")
+            params += [name] + filter_params
+
+        counts: Dict[str, Dict[str, int]] = {"totals": {}, "filters": {}, "categories": {}, "tags": {}}
+        with self.get_connection() as conn:
+            for row in conn.execute(" UNION ALL ".join(parts), params):
+                counts[row['kind']][row['name']] = row['count']
+        return counts
     
 
     
@@ -662,6 +1040,55 @@ class ArticleDatabase:
             """, (article_id, tag_name))
             return cursor.rowcount > 0
     
+    def update_article_tags(self, article_id: str, tags_to_add: List[str],
+                            tags_to_remove: List[str]) -> Tuple[bool, int]:
+        """Add and remove several tags of an article in one transaction.
+        
+        Like add_article_tag, adding a tag marks the article as saved. Tags left
+        without articles by the removals are deleted. Returns whether any tag
+        was added and the number of unused tags deleted.
+        """
+        now = datetime.now().isoformat()
+        with self.get_connection() as conn:
+            if tags_to_remove:
+                conn.executemany("""
+                    DELETE FROM article_tags 
+                    WHERE article_id = ? AND tag_id = (
+                        SELECT id FROM tags WHERE name = ?
+                    )
+                """, [(article_id, tag_name) for tag_name in tags_to_remove])
+            
+            tags_added = False
+            if tags_to_add:
+                conn.executemany("""
+                    INSERT OR IGNORE INTO tags (name, created_at) VALUES (?, ?)
+                """, [(tag_name, now) for tag_name in tags_to_add])
+                cursor = conn.executemany("""
+                    INSERT OR IGNORE INTO article_tags (article_id, tag_id, created_at)
+                    SELECT ?, id, ? FROM tags WHERE name = ?
+                """, [(article_id, now, tag_name) for tag_name in tags_to_add])
+                tags_added = cursor.rowcount > 0
+            
+            if tags_added:
+                # Same as add_article_tag: tagged articles are saved
+                conn.execute("""
+                    INSERT OR REPLACE INTO article_status (article_id, is_saved, is_viewed, saved_at, viewed_at)
+                    VALUES (?, 1, 
+                            COALESCE((SELECT is_viewed FROM article_status WHERE article_id = ?), 0),
+                            ?,
+                            (SELECT viewed_at FROM article_status WHERE article_id = ?))
+                """, (article_id, article_id, now, article_id))
+            
+            removed_tags = 0
+            if tags_to_remove:
+                cursor = conn.execute("""
+                    DELETE FROM tags
+                    WHERE id NOT IN (SELECT DISTINCT tag_id FROM article_tags)
+                """)
+                removed_tags = cursor.rowcount
+            
+            return tags_added, removed_tags
+    
     def get_article_tags(self, article_id: str) -> List[str]:
         """Get all tags for a specific article."""
         with self.get_connection() as conn:
@@ -674,11 +1101,15 @@ class ArticleDatabase:
             """, (article_id,))
             return [row['name'] for row in cursor.fetchall()]
     
-    def get_articles_by_tag(self, tag_name: str) -> List[Dict]:
-        """Get articles with a specific tag."""
+    def get_articles_by_tag(self, tag_name: str, query: Optional[str] = None) -> List[sqlite3.Row]:
+        """Get articles with a specific tag, optionally matching a search query."""
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT a.*, s.is_saved, s.is_viewed, s.saved_at, s.viewed_at,
+            if query:
+                text_filter, params = self._get_text_search_filter(query)
+            else:
+                text_filter, params = "1=1", []
+            cursor = conn.execute(f"""
+                SELECT {_ARTICLE_LIST_COLUMNS}, s.is_saved, s.is_viewed, s.saved_at, s.viewed_at,
                        1 as has_tags
                 FROM articles a
                 LEFT JOIN article_status s ON a.id = s.article_id
@@ -686,9 +1117,10 @@ class ArticleDatabase:
                 INNER JOIN article_tags at ON a.id = at.article_id
                 INNER JOIN tags t ON at.tag_id = t.id
                 WHERE t.name = ?
+                  AND {text_filter}
                 ORDER BY a.published_date DESC
-            """, (tag_name,))
-            return [dict(row) for row in cursor.fetchall()]
+            """, [tag_name] + params)
+            return cursor.fetchall()
     def get_count_by_tag(self, tag_name: str) -> int:
         """Get count of all articles for a specific tag, regardless of status."""
         with self.get_connection() as conn:
@@ -714,6 +1146,20 @@ class ArticleDatabase:
             """, (tag_name,))
             return cursor.fetchone()['count']
     
+    def get_unread_counts_by_tag(self) -> Dict[str, int]:
+        """Get unread article counts for all tags; tags without unread articles are omitted."""
+        with self.get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT t.name, COUNT(*) as count
+                FROM tags t
+                INNER JOIN article_tags at ON t.id = at.tag_id
+                INNER JOIN articles a ON a.id = at.article_id
+                LEFT JOIN article_status s ON a.id = s.article_id
+                WHERE s.is_viewed IS NULL OR s.is_viewed = 0
+                GROUP BY t.name
+            """)
+            return {row['name']: row['count'] for row in cursor}
+    
     def cleanup_orphan_tags(self) -> int:
         """Remove tags that are no longer associated with any articles. Returns number of tags removed."""
         with self.get_connection() as conn:
@@ -734,21 +1180,18 @@ class ArticleDatabase:
             return 0
 
         with self.get_connection() as conn:
-            placeholders = ",".join("?" * len(category_codes))
+            category_filter, params = self._get_category_filter(category_codes)
             cursor = conn.execute(f"""
                 SELECT a.id
                 FROM articles a
                 LEFT JOIN article_status s ON a.id = s.article_id
                 WHERE (s.is_saved IS NULL OR s.is_saved = 0)
                 AND a.notes_file_path IS NULL
-                AND NOT EXISTS (
-                    SELECT 1 FROM json_each(a.categories)
-                    WHERE json_each.value IN ({placeholders})
-                )
+                AND NOT {category_filter}
                 AND NOT EXISTS (
                     SELECT 1 FROM article_tags WHERE article_id = a.id
                 )
-            """, category_codes)
+            """, params)
 
             article_ids_to_delete = [row["id"] for row in cursor.fetchall()]
 
@@ -870,15 +1313,20 @@ class ArticleDatabase:
     
     # Category fetch tracking methods
     
-    def update_category_fetch_info(self, category_code: str, category_name: str, article_count: int) -> None:
-        """Update information about when a category was last fetched."""
+    def update_category_fetch_info(self, category_code: str, category_name: str, article_count: int,
+                                   fetch_query: Optional[str] = None, fetch_days: Optional[int] = None) -> None:
+        """Update information about when a category was last fetched.
+
+        ``fetch_query`` and ``fetch_days`` record what an incremental fetch covered,
+        so a later fetch can tell whether it may continue from this one.
+        """
         now = datetime.now().isoformat()
         with self.get_connection() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO fetched_categories 
-                (category_code, category_name, last_fetched, article_count)
-                VALUES (?, ?, ?, ?)
-            """, (category_code, category_name, now, article_count))
+                (category_code, category_name, last_fetched, article_count, fetch_query, fetch_days)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (category_code, category_name, now, article_count, fetch_query, fetch_days))
     
     def get_category_fetch_info(self, category_code: str) -> Optional[Dict]:
         """Get information about when a category was last fetched."""
@@ -890,6 +1338,41 @@ class ArticleDatabase:
             row = cursor.fetchone()
             return dict(row) if row else None
     
+    def get_all_category_fetch_info(self) -> Dict[str, Dict]:
+        """Get the fetch information of every category and filter, keyed by category code."""
+        with self.get_connection() as conn:
+            cursor = conn.execute("SELECT * FROM fetched_categories")
+            return {row['category_code']: dict(row) for row in cursor.fetchall()}
+    
+    # Inspire-HEP citation cache methods
+    
+    def get_cached_citation(self, base_article_id: str, max_age_seconds: float) -> Optional[Dict]:
+        """Get a cached Inspire-HEP lookup that is younger than ``max_age_seconds``."""
+        with self.get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT inspire_id, bibtex, n_citations, reference_ids
+                FROM inspire_citations
+                WHERE base_article_id = ? AND fetched_at > ?
+            """, (base_article_id, time.time() - max_age_seconds))
+            
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            citation = dict(row)
+            citation['reference_ids'] = json.loads(citation['reference_ids'])
+            return citation
+    
+    def cache_citation(self, base_article_id: str, inspire_id: int, bibtex: str,
+                       n_citations: int, reference_ids: List) -> None:
+        """Store the result of an Inspire-HEP lookup, replacing any older one."""
+        with self.get_connection() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO inspire_citations
+                (base_article_id, inspire_id, bibtex, n_citations, reference_ids, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (base_article_id, inspire_id, bibtex, n_citations,
+                  json.dumps(reference_ids), time.time()))
+    
     # Migration methods
     
     def migrate_from_text_files(self, saved_file: Optional[str] = None, viewed_file: Optional[str] = None) -> Dict[str, int]:
@@ -1,26 +1,55 @@
 """Article fetching functionality for ArTui."""
 
-import arxiv
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable, Any
+import hashlib
+import itertools
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Dict, List, Optional, Callable, Any, Tuple
 
 from .database import ArticleDatabase
 from .config import ConfigManager
 
+if TYPE_CHECKING:
+    import arxiv
+
 
 class ArticleFetcher:
     """Handles fetching articles from arXiv API."""
+
+    # arXiv publishes new listings once a day, so identical global searches
+    # are answered from disk for this long
+    SEARCH_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+    SEARCH_CACHE_DIR_NAME = "arxiv"
     
     def __init__(self, db: ArticleDatabase, config_manager: ConfigManager):
         self.db = db
         self.config_manager = config_manager
-        # Single shared client so the 3-second delay between requests is tracked
-        # globally across all fetches, keeping us within arXiv's rate limit.
-        self._client = arxiv.Client(page_size=100, delay_seconds=3.0, num_retries=3)
+        self._arxiv_client = None
+
+    @property
+    def _client(self) -> "arxiv.Client":
+        """The arXiv client, created (and the arxiv package imported) on first use."""
+        if self._arxiv_client is None:
+            import arxiv
+            # Single shared client so the 3-second delay between requests is tracked
+            # globally across all fetches, keeping us within arXiv's rate limit.
+            self._arxiv_client = arxiv.Client(page_size=100, delay_seconds=3.0, num_retries=3)
+        return self._arxiv_client
     
-    def should_fetch_category(self, category_code: str, hours_threshold: int = 6) -> bool:
-        """Check if category should be fetched based on last fetch time."""
-        fetch_info = self.db.get_category_fetch_info(category_code)
+    def should_fetch_category(self, category_code: str, hours_threshold: int = 6,
+                              fetch_infos: Optional[Dict[str, Dict]] = None) -> bool:
+        """Check if category should be fetched based on last fetch time.
+
+        Pass ``fetch_infos`` from get_all_category_fetch_info() when checking
+        several categories, so the database is read only once.
+        """
+        if fetch_infos is None:
+            fetch_info = self.db.get_category_fetch_info(category_code)
+        else:
+            fetch_info = fetch_infos.get(category_code)
         
         if not fetch_info:
             return True  # Never fetched before
@@ -49,8 +78,66 @@ class ArticleFetcher:
             # Specific sub-category like 'hep-th', 'cs.AI', 'astro-ph.CO'
             return f"cat:{category_code}"
     
+    # arXiv announces new submissions up to a few days after they are submitted
+    # (weekends, holidays), so incremental refreshes re-scan this overlap.
+    _RECENT_FETCH_OVERLAP = timedelta(days=4)
+
+    def _get_recent_fetch_start(self, batch_key: str, query: str, days: int,
+                                fetch_infos: Dict[str, Dict]) -> datetime:
+        """Get the UTC start of the refresh window for a category/filter batch.
+
+        The last fetch only shortens the window if it used the same query and
+        window; after either changes (an edited filter, a larger ``days``) the
+        whole window is fetched again.
+        """
+        start = datetime.now(timezone.utc) - timedelta(days=days)
+        fetch_info = fetch_infos.get(f"recent_{batch_key}")
+        if (fetch_info and fetch_info.get('fetch_query') == query
+                and fetch_info.get('fetch_days') == days):
+            # last_fetched is stored as naive local time
+            last_fetched = datetime.fromisoformat(fetch_info['last_fetched']).astimezone(timezone.utc)
+            start = max(start, last_fetched - self._RECENT_FETCH_OVERLAP)
+        return start
+
+    def _fetch_recent_batch(self, query: str, from_date: datetime, max_results: int) -> List["arxiv.Result"]:
+        """Fetch articles matching query submitted since from_date (UTC), newest first."""
+        import arxiv
+
+        now = datetime.now(timezone.utc)
+        search = arxiv.Search(
+            query=f"({query}) AND submittedDate:[{from_date:%Y%m%d%H%M} TO {now:%Y%m%d%H%M}]",
+            max_results=max_results,
+            sort_by=arxiv.SortCriterion.SubmittedDate
+        )
+
+        articles = []
+        for article in self._client.results(search):
+            if article.published.replace(tzinfo=timezone.utc) >= from_date:
+                articles.append(article)
+            else:
+                break  # Articles are sorted by date, so we can stop
+        return articles
+
+    def _add_search_results(self, search: "arxiv.Search") -> Tuple[int, int]:
+        """Store the results of an arXiv search page by page.
+
+        Each page is written while the client waits out its request delay before
+        fetching the next one. Returns the number of articles fetched and added.
+        """
+        results = self._client.results(search)
+        fetched_count = added_count = 0
+        while True:
+            page = list(itertools.islice(results, self._client.page_size))
+            if not page:
+                break
+            fetched_count += len(page)
+            added_count += self.db.add_articles_batch(page)
+        return fetched_count, added_count
+
     def fetch_category_articles(self, category_code: str, category_name: str, max_results: int = 200) -> int:
         """Fetch articles for a specific category and store in database."""
+        import arxiv
+
         print(f"Fetching articles for {category_name} ({category_code})...")
         
         try:
@@ -63,15 +150,13 @@ class ArticleFetcher:
                 sort_by=arxiv.SortCriterion.SubmittedDate
             )
             
-            articles = list(self._client.results(search))
-            
-            # Add articles to database
-            added_count = self.db.add_articles_batch(articles)
+            # Add articles to database as they arrive
+            fetched_count, added_count = self._add_search_results(search)
             
             # Update fetch info
-            self.db.update_category_fetch_info(category_code, category_name, len(articles))
+            self.db.update_category_fetch_info(category_code, category_name, fetched_count)
             
-            print(f"  Fetched {len(articles)} articles, {added_count} new articles added")
+            print(f"  Fetched {fetched_count} articles, {added_count} new articles added")
             return added_count
             
         except Exception as e:
@@ -80,6 +165,8 @@ class ArticleFetcher:
     
     def fetch_filter_articles(self, filter_name: str, filter_config: Dict, max_results: int = 200) -> int:
         """Fetch articles for a specific filter and store in database."""
+        import arxiv
+
         print(f"Fetching articles for filter: {filter_name}...")
         
         try:
@@ -111,15 +198,13 @@ class ArticleFetcher:
                 sort_by=arxiv.SortCriterion.SubmittedDate
             )
             
-            articles = list(self._client.results(search))
-            
-            # Add articles to database
-            added_count = self.db.add_articles_batch(articles)
+            # Add articles to database as they arrive
+            fetched_count, added_count = self._add_search_results(search)
             
             # Update fetch info for filter (using filter name as category code)
-            self.db.update_category_fetch_info(f"filter_{filter_name}", filter_name, len(articles))
+            self.db.update_category_fetch_info(f"filter_{filter_name}", filter_name, fetched_count)
             
-            print(f"  Fetched {len(articles)} articles, {added_count} new articles added")
+            print(f"  Fetched {fetched_count} articles, {added_count} new articles added")
             return added_count
             
         except Exception as e:
@@ -131,13 +216,14 @@ class ArticleFetcher:
         print("Starting article fetch for all categories...")
         results = {}
         config = self.config_manager.get_config()
+        fetch_infos = self.db.get_all_category_fetch_info()
         
         # Fetch categories
         categories = config.get("categories", {})
         if categories:
             print(f"\nFetching {len(categories)} categories:")
             for category_name, category_code in categories.items():
-                if force or self.should_fetch_category(category_code):
+                if force or self.should_fetch_category(category_code, fetch_infos=fetch_infos):
                     added_count = self.fetch_category_articles(category_code, category_name)
                     results[f"category_{category_code}"] = added_count
                 else:
@@ -150,7 +236,7 @@ class ArticleFetcher:
             print(f"\nFetching {len(filters)} filters:")
             for filter_name, filter_config in filters.items():
                 filter_key = f"filter_{filter_name}"
-                if force or self.should_fetch_category(filter_key):
+                if force or self.should_fetch_category(filter_key, fetch_infos=fetch_infos):
                     added_count = self.fetch_filter_articles(filter_name, filter_config)
                     results[filter_key] = added_count
                 else:
@@ -178,9 +264,7 @@ class ArticleFetcher:
         results = {}
         config = self.config_manager.get_config()
         request_delay = getattr(self._client, "delay_seconds", None)
-        
-        # Calculate date filter
-        from_date = datetime.now() - timedelta(days=days)
+        fetch_infos = self.db.get_all_category_fetch_info()
         
         # Fetch categories
         categories = config.get("categories", {})
@@ -215,19 +299,8 @@ class ArticleFetcher:
                 })
                 try:
                     query = self._build_category_query(category_code)
-                    
-                    search = arxiv.Search(
-                        query=query,
-                        max_results=max_per_category,
-                        sort_by=arxiv.SortCriterion.SubmittedDate
-                    )
-                    
-                    articles = []
-                    for article in self._client.results(search):
-                        if article.published.replace(tzinfo=None) >= from_date:
-                            articles.append(article)
-                        else:
-                            break  # Articles are sorted by date, so we can stop
+                    from_date = self._get_recent_fetch_start(f"category_{category_code}", query, days, fetch_infos)
+                    articles = self._fetch_recent_batch(query, from_date, max_per_category)
                     
                     if articles:
                         added_count = self.db.add_articles_batch(articles)
@@ -236,6 +309,10 @@ class ArticleFetcher:
                     else:
                         results[f"category_{category_code}"] = 0
                         print(f"  No new recent articles")
+                    self.db.update_category_fetch_info(
+                        f"recent_category_{category_code}", category_name, len(articles),
+                        fetch_query=query, fetch_days=days,
+                    )
                     completed_batches += 1
                     emit_progress({
                         "event": "batch_completed",
@@ -310,19 +387,8 @@ class ArticleFetcher:
                         continue
                     
                     query_string = " AND ".join(search_terms)
-                    
-                    search = arxiv.Search(
-                        query=query_string,
-                        max_results=max_per_category,
-                        sort_by=arxiv.SortCriterion.SubmittedDate
-                    )
-                    
-                    articles = []
-                    for article in self._client.results(search):
-                        if article.published.replace(tzinfo=None) >= from_date:
-                            articles.append(article)
-                        else:
-                            break  # Articles are sorted by date, so we can stop
+                    from_date = self._get_recent_fetch_start(f"filter_{filter_name}", query_string, days, fetch_infos)
+                    articles = self._fetch_recent_batch(query_string, from_date, max_per_category)
                     
                     if articles:
                         added_count = self.db.add_articles_batch(articles)
@@ -331,6 +397,10 @@ class ArticleFetcher:
                     else:
                         results[f"filter_{filter_name}"] = 0
                         print(f"  No new recent articles")
+                    self.db.update_category_fetch_info(
+                        f"recent_filter_{filter_name}", filter_name, len(articles),
+                        fetch_query=query_string, fetch_days=days,
+                    )
                     completed_batches += 1
                     emit_progress({
                         "event": "batch_completed",
@@ -371,7 +441,7 @@ class ArticleFetcher:
         
         return results
     
-    def search_arxiv(self, query: str, max_results: int = 100, sort_by: str = "relevance") -> List[arxiv.Result]:
+    def search_arxiv(self, query: str, max_results: int = 100, sort_by: str = "relevance") -> List["arxiv.Result"]:
         """Search arXiv directly for global search functionality.
         
         Args:
@@ -379,6 +449,8 @@ class ArticleFetcher:
             max_results: Maximum number of results to return
             sort_by: Sort criteria - "relevance", "submitted_date", or "last_updated_date"
         """
+        import arxiv
+
         try:
             # Map sort_by string to arxiv.SortCriterion
             sort_mapping = {
@@ -395,15 +467,103 @@ class ArticleFetcher:
                 sort_by=sort_criterion
             )
             
-            results = list(self._client.results(search))
+            cache_path = self._search_cache_path(query, max_results, sort_by)
+            results = self._read_search_cache(cache_path)
+            if results is None:
+                results = list(self._client.results(search))
+                self._write_search_cache(cache_path, results)
             
             return results
             
         except Exception as e:
             print(f"Error searching arXiv: {e}")
             return []
+
+    def _search_cache_path(self, query: str, max_results: int, sort_by: str) -> str:
+        """Get the cache file for a global search."""
+        key = hashlib.sha1(f"{query}\0{max_results}\0{sort_by}".encode("utf-8")).hexdigest()
+        return os.path.join(
+            self.config_manager.user_dirs.cache_dir, self.SEARCH_CACHE_DIR_NAME, f"{key}.json"
+        )
+
+    def _read_search_cache(self, cache_path: str) -> Optional[List["arxiv.Result"]]:
+        """Load cached search results, or None if missing, stale or unreadable."""
+        import arxiv
+
+        try:
+            if time.time() - os.path.getmtime(cache_path) > self.SEARCH_CACHE_MAX_AGE_SECONDS:
+                return None
+            with open(cache_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            return [
+                arxiv.Result(
+                    entry_id=entry["entry_id"],
+                    updated=datetime.fromisoformat(entry["updated"]),
+                    published=datetime.fromisoformat(entry["published"]),
+                    title=entry["title"],
+                    authors=[arxiv.Result.Author(name) for name in entry["authors"]],
+                    summary=entry["summary"],
+                    comment=entry["comment"],
+                    journal_ref=entry["journal_ref"],
+                    doi=entry["doi"],
+                    primary_category=entry["primary_category"],
+                    categories=entry["categories"],
+                    links=[arxiv.Result.Link(**link) for link in entry["links"]],
+                )
+                for entry in entries
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_search_cache(self, cache_path: str, results: List["arxiv.Result"]) -> None:
+        """Atomically store search results and drop expired cache files."""
+        entries = [
+            {
+                "entry_id": result.entry_id,
+                "updated": result.updated.isoformat(),
+                "published": result.published.isoformat(),
+                "title": result.title,
+                "authors": [author.name for author in result.authors],
+                "summary": result.summary,
+                "comment": result.comment,
+                "journal_ref": result.journal_ref,
+                "doi": result.doi,
+                "primary_category": result.primary_category,
+                "categories": result.categories,
+                "links": [
+                    {
+                        "href": link.href,
+                        "title": link.title,
+                        "rel": link.rel,
+                        "content_type": link.content_type,
+                    }
+                    for link in result.links
+                ],
+            }
+            for result in results
+        ]
+
+        cache_dir = os.path.dirname(cache_path)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, cache_path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+
+            expiry = time.time() - self.SEARCH_CACHE_MAX_AGE_SECONDS
+            for name in os.listdir(cache_dir):
+                path = os.path.join(cache_dir, name)
+                if name.endswith(".json") and os.path.getmtime(path) < expiry:
+                    os.unlink(path)
+        except OSError:
+            pass  # The cache is only an optimization
     
-    def fetch_articles_by_ids(self, arxiv_ids: List[str]) -> List[arxiv.Result]:
+    def fetch_articles_by_ids(self, arxiv_ids: List[str]) -> List["arxiv.Result"]:
         """Fetch specific arXiv articles by their IDs.
         
         Args:
@@ -412,6 +572,8 @@ class ArticleFetcher:
         Returns:
             List of arxiv.Result objects for the found articles
         """
+        import arxiv
+
         if not arxiv_ids:
             return []
             
@@ -1,9 +1,7 @@
 """Modal screens for ArTui."""
 
+import asyncio
 import os
-import re
-import platform
-import subprocess
 from typing import Optional, List, Dict, Any
 
 from textual.containers import Horizontal, Vertical, VerticalScroll
@@ -13,7 +11,7 @@ from textual.widgets import (
 from textual.screen import ModalScreen
 from textual import events
 
-from .utils import get_arxiv_ids_from_inspire_ids
+from .utils import copy_to_clipboard, get_arxiv_ids_from_inspire_ids, sanitize_widget_id
 
 
 class SelectionPopupScreen(ModalScreen):
@@ -96,21 +94,7 @@ class BibtexPopupScreen(ModalScreen):
     def _copy_bibtex_to_clipboard(self) -> None:
         """Copy BibTeX content to clipboard using the most reliable available method."""
         try:
-            if platform.system() == "Darwin":
-                subprocess.run(["pbcopy"], input=self.bibtex_content.encode(), timeout=3, check=True)
-            elif platform.system() == "Linux":
-                for cmd in (["wl-copy"], ["xclip", "-selection", "clipboard"], ["xsel", "--clipboard", "--input"]):
-                    try:
-                        subprocess.run(cmd, input=self.bibtex_content.encode(), timeout=3, check=True)
-                        self.notify("BibTeX copied to clipboard", timeout=2)
-                        return
-                    except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
-                        continue
-                import pyperclip
-                pyperclip.copy(self.bibtex_content)
-            else:
-                import pyperclip
-                pyperclip.copy(self.bibtex_content)
+            copy_to_clipboard(self.bibtex_content)
             self.notify("BibTeX copied to clipboard", timeout=2)
         except Exception as e:
             self.notify(f"Failed to copy to clipboard: {e}", severity="warning", timeout=3)
@@ -190,6 +174,7 @@ class TagPopupScreen(ModalScreen):
         self.article_title = article_title
         self.existing_tags = set(existing_tags) if existing_tags else set()
         self.all_tags = all_tags if all_tags else []
+        self._lower_tag_names = {tag['name'].lower() for tag in self.all_tags}
         self.checkboxes = {}
 
     def compose(self):
@@ -208,7 +193,7 @@ class TagPopupScreen(ModalScreen):
                 if self.all_tags:
                     for tag_data in self.all_tags:
                         tag_name = tag_data['name']
-                        sanitized_tag_name = re.sub(r'[^a-zA-Z0-9_-]', '_', tag_name)
+                        sanitized_tag_name = sanitize_widget_id(tag_name)
                         is_checked = tag_name in self.existing_tags
                         checkbox = Checkbox(f"{tag_name} ({tag_data['article_count']})", 
                                           value=is_checked, 
@@ -246,7 +231,7 @@ class TagPopupScreen(ModalScreen):
             return
             
         # Check if tag already exists
-        if any(tag['name'].lower() == tag_name.lower() for tag in self.all_tags):
+        if tag_name.lower() in self._lower_tag_names:
             self.notify(f"Tag '{tag_name}' already exists", severity="warning")
             new_tag_input.value = ""
             return
@@ -254,9 +239,10 @@ class TagPopupScreen(ModalScreen):
         # Add to all_tags list and create checkbox
         new_tag_data = {'name': tag_name, 'article_count': 0}
         self.all_tags.append(new_tag_data)
+        self._lower_tag_names.add(tag_name.lower())
         
         # Create and add checkbox
-        sanitized_tag_name = re.sub(r'[^a-zA-Z0-9_-]', '_', tag_name)
+        sanitized_tag_name = sanitize_widget_id(tag_name)
         checkbox = Checkbox(f"{tag_name} (0)", value=True, id=f"tag_checkbox_{sanitized_tag_name}")
         self.checkboxes[tag_name] = checkbox
         
@@ -293,6 +279,21 @@ class TagPopupScreen(ModalScreen):
         if event.key == "escape":
             self.dismiss()
 
+def _read_notes_file(path: str) -> str:
+    """Read a notes file, or return an empty string if it does not exist yet."""
+    try:
+        with open(path, "r") as f:
+            return f.read()
+    except FileNotFoundError:
+        return ""
+
+
+def _write_notes_file(path: str, content: str) -> None:
+    """Write a notes file."""
+    with open(path, "w") as f:
+        f.write(content)
+
+
 class NotesPopupScreen(ModalScreen):
     """Screen to display and edit notes for an article."""
 
@@ -304,16 +305,13 @@ class NotesPopupScreen(ModalScreen):
         self.original_content = ""
 
     def compose(self):
-        # Read initial content
-        if os.path.exists(self.notes_path):
-            with open(self.notes_path, "r") as f:
-                self.original_content = f.read()
-
+        # The notes are read in on_mount; until then the editor stays read-only
+        # and Save is disabled so an empty buffer cannot overwrite the file
         yield Vertical(
             Static(f"Notes for: {self.article_title[:60]}{'...' if len(self.article_title) > 60 else ''}", id="notes_popup_title"),
-            TextArea(self.original_content, id="notes_text_area", language="markdown", theme="monokai"),
+            TextArea(id="notes_text_area", language="markdown", theme="monokai", read_only=True),
             Horizontal(
-                Button("Save", variant="primary", id="notes_save_button"),
+                Button("Save", variant="primary", id="notes_save_button", disabled=True),
                 Button("Delete", variant="error", id="notes_delete_button"),
                 Button("Close", id="notes_close_button"),
                 id="notes_buttons"
@@ -321,16 +319,24 @@ class NotesPopupScreen(ModalScreen):
             id="notes_popup_dialog",
         )
 
-    def on_mount(self) -> None:
-        self.query_one(TextArea).focus()
+    async def on_mount(self) -> None:
+        text_area = self.query_one(TextArea)
+        text_area.focus()
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+        # Read the file in a thread so slow storage does not stall the UI
+        loop = asyncio.get_running_loop()
+        self.original_content = await loop.run_in_executor(None, _read_notes_file, self.notes_path)
+        text_area.load_text(self.original_content)
+        text_area.read_only = False
+        self.query_one("#notes_save_button", Button).disabled = False
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "notes_close_button":
             self.dismiss(None)
         elif event.button.id == "notes_save_button":
             new_content = self.query_one(TextArea).text
-            with open(self.notes_path, "w") as f:
-                f.write(new_content)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _write_notes_file, self.notes_path, new_content)
             self.dismiss(new_content)
         elif event.button.id == "notes_delete_button":
             self._delete_notes()
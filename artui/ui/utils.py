@@ -1,58 +1,172 @@
 """UI utility classes and functions."""
 
 import os
+import re
 import json
-import requests
+import logging
+import platform
+import shutil
+import subprocess
 from datetime import datetime
-from typing import Dict, Any, List
+from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Callable, List, Mapping, Optional
+
+logger = logging.getLogger("artui")
+
+
+def _parse_published_date_with_z(value: str) -> datetime:
+    """Parse an ISO date string, accepting a trailing 'Z' on older Pythons."""
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+# orjson decodes the JSON author/category columns several times faster, if installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _decode_json_list(value: Any) -> List[Any]:
+    """Decode a JSON list column; values that are already decoded pass through."""
+    if not isinstance(value, str):
+        return value or []
+    # Decode errors of both JSON parsers are ValueErrors
+    try:
+        return _json_loads(value)
+    except ValueError:
+        return []
+
+
+# PDFs are copied to disk in blocks of this many bytes
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+# Characters dropped from PDF file names: anything but letters, digits, '.', '-' and '_'
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w.-]+')
+
+
+# Shared HTTP session for Inspire-HEP and PDF requests, created on first use
+_http_session = None
+
+
+def get_http_session():
+    """Get the shared requests session, so repeated requests reuse their connections."""
+    global _http_session
+    if _http_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        # Retries only cover failed connections; all requests made here are GETs
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=3)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
+
+# Stand-in for arxiv.Result.Author; only the name is stored in the database
+Author = namedtuple('Author', ['name'])
+
+
+# Python 3.11+ parses the 'Z' suffix natively; pick the parser once at import
+try:
+    datetime.fromisoformat("2000-01-01T00:00:00Z")
+    _parse_published_date = datetime.fromisoformat
+except ValueError:
+    _parse_published_date = _parse_published_date_with_z
 
 
 class MockArticle:
-    """Mock article object that mimics arxiv.Result for database results."""
-    
-    def __init__(self, db_result: Dict[str, Any]):
+    """Mock article object that mimics arxiv.Result for database results.
+
+    Accepts any mapping with the article columns, e.g. an sqlite3.Row.
+    """
+
+    __slots__ = (
+        'id', 'entry_id', 'title', '_summary', '_load_summary', 'pdf_url',
+        '_authors_json', '_categories_json', '_authors', '_categories', '_authors_str', '_categories_str',
+        'published_date', 'published_day', '_published',
+        'is_saved', 'is_viewed', 'has_tags', 'notes_file_path', 'has_note',
+    )
+
+    def __init__(self, db_result: Mapping[str, Any],
+                 load_summary: Optional[Callable[[str], str]] = None):
         self.id = db_result['id']
         self.entry_id = db_result['entry_id']
         self.title = db_result['title']
-        self.summary = db_result['summary']
+        # List queries leave out the abstract; it is loaded when first needed
+        self._load_summary = load_summary
+        self._summary = db_result['summary'] if load_summary is None else None
         self.pdf_url = db_result['pdf_url']
         
-        # Parse JSON fields
-        try:
-            if isinstance(db_result['authors'], str):
-                author_names = json.loads(db_result['authors'])
-            else:
-                author_names = db_result['authors'] or []
-        except (json.JSONDecodeError, ValueError):
-            author_names = []
-
-        try:
-            if isinstance(db_result['categories'], str):
-                self.categories = json.loads(db_result['categories'])
-            else:
-                self.categories = db_result['categories'] or []
-        except (json.JSONDecodeError, ValueError):
-            self.categories = []
-        
-        # Create mock author objects
-        self.authors = []
-        for name in author_names:
-            author = type('Author', (), {'name': name})()
-            self.authors.append(author)
+        # The JSON author and category columns are decoded on first use; the
+        # table only renders a page of rows, so most results never need them
+        self._authors_json = db_result['authors']
+        self._categories_json = db_result['categories']
+        self._authors = None
+        self._categories = None
+        self._authors_str = None
+        self._categories_str = None
         
-        # Parse published date
-        if 'T' in db_result['published_date']:
-            self.published = datetime.fromisoformat(db_result['published_date'].replace('Z', '+00:00'))
-        else:
-            self.published = datetime.fromisoformat(db_result['published_date'])
+        # Parsing the ISO timestamp is deferred until something needs the datetime;
+        # the table only shows the date, which is the string's first ten characters
+        self.published_date = db_result['published_date']
+        self.published_day = self.published_date[:10]
+        self._published = None
         
         # Add status information
-        self.is_saved = bool(db_result.get('is_saved', 0))
-        self.is_viewed = bool(db_result.get('is_viewed', 0))
-        self.has_tags = bool(db_result.get('has_tags', 0))
-        self.notes_file_path = db_result.get('notes_file_path')
+        self.is_saved = bool(db_result['is_saved'])
+        self.is_viewed = bool(db_result['is_viewed'])
+        self.has_tags = bool(db_result['has_tags'])
+        self.notes_file_path = db_result['notes_file_path']
         self.has_note = bool(self.notes_file_path)
     
+    @property
+    def published(self) -> datetime:
+        """Publication time, parsed from the stored ISO string on first use."""
+        if self._published is None:
+            self._published = _parse_published_date(self.published_date)
+        return self._published
+    
+    @property
+    def authors(self) -> List[Author]:
+        """Author objects, decoded from the JSON column on first use."""
+        if self._authors is None:
+            self._authors = [Author(name) for name in _decode_json_list(self._authors_json)]
+        return self._authors
+    
+    @property
+    def authors_str(self) -> str:
+        """Comma-separated author names, as shown in the table and abstract view."""
+        if self._authors_str is None:
+            self._authors_str = ", ".join(author.name for author in self.authors)
+        return self._authors_str
+    
+    @property
+    def categories(self) -> List[str]:
+        """Category codes, decoded from the JSON column on first use."""
+        if self._categories is None:
+            self._categories = _decode_json_list(self._categories_json)
+        return self._categories
+    
+    @property
+    def categories_str(self) -> str:
+        """Comma-separated category codes, as shown in the table and abstract view."""
+        if self._categories_str is None:
+            self._categories_str = ", ".join(self.categories)
+        return self._categories_str
+    
+    @property
+    def summary(self) -> str:
+        """Abstract, loaded through ``load_summary`` on first use if not in the row."""
+        if self._summary is None:
+            self._summary = self._load_summary(self.id)
+        return self._summary
+    
     def get_short_id(self) -> str:
         """Get the short arXiv ID."""
         return self.id
@@ -61,7 +175,7 @@ class MockArticle:
         """Construct filepath for PDF file."""
         filename = f"{self.id}.{self.title[:50].replace('/', '_').replace(':', '_')}.pdf"
         # Remove any problematic characters
-        filename = "".join(c for c in filename if c.isalnum() or c in '.-_')
+        filename = _UNSAFE_FILENAME_RE.sub('', filename)
         filepath = os.path.join(dirpath, filename)
         return filepath
     
@@ -75,13 +189,14 @@ class MockArticle:
         filepath = self.construct_filepath(dirpath)
 
         if not self.is_downloaded(dirpath):
-            response = requests.get(self.pdf_url, stream=True)
+            response = get_http_session().get(self.pdf_url, stream=True, timeout=30)
             response.raise_for_status()
+            # Let urllib3 undo any transfer encoding while copying the raw stream
+            response.raw.decode_content = True
 
             try:
                 with open(filepath, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                    shutil.copyfileobj(response.raw, f, _DOWNLOAD_CHUNK_SIZE)
             except Exception:
                 # Remove partial file so the next attempt re-downloads cleanly
                 if os.path.exists(filepath):
@@ -91,15 +206,51 @@ class MockArticle:
         return filepath
 
 
-def convert_db_results_to_articles(db_results: List[Dict[str, Any]]) -> List[MockArticle]:
-    """Convert database results to MockArticle objects."""
-    return [MockArticle(result) for result in db_results]
+# Characters that are not allowed in Textual widget ids
+_WIDGET_ID_UNSAFE_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
+
+@lru_cache(maxsize=512)
+def sanitize_widget_id(text: str) -> str:
+    """Turn a category code, filter or tag name into a valid widget id fragment."""
+    return _WIDGET_ID_UNSAFE_RE.sub('_', text)
+
+
+def convert_db_results_to_articles(db_results: List[Mapping[str, Any]],
+                                   load_summary: Optional[Callable[[str], str]] = None) -> List[MockArticle]:
+    """Convert database results to MockArticle objects.
+
+    Pass ``load_summary`` (e.g. ArticleDatabase.get_article_summary) when the
+    rows were queried without the summary column.
+    """
+    return [MockArticle(result, load_summary) for result in db_results]
+
+
+def copy_to_clipboard(text: str) -> None:
+    """Copy text to the system clipboard; raises if no method works.
+
+    Uses the platform's clipboard tool where there is one and falls back to
+    pyperclip, which is only imported when it is needed.
+    """
+    system = platform.system()
+    if system == "Darwin":
+        subprocess.run(["pbcopy"], input=text.encode(), timeout=3, check=True)
+        return
+    if system == "Linux":
+        # Try Wayland first, then X11 tools
+        for cmd in (["wl-copy"], ["xclip", "-selection", "clipboard"], ["xsel", "--clipboard", "--input"]):
+            try:
+                subprocess.run(cmd, input=text.encode(), timeout=3, check=True)
+                return
+            except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
+                continue
+    import pyperclip
+    pyperclip.copy(text)
 
 
 def debug_log(msg: str) -> None:
-    """Write debug message to stderr."""
-    import sys
-    print(f"DEBUG: {msg}", file=sys.stderr, flush=True)
+    """Log a debug message; dropped unless DEBUG logging is configured."""
+    logger.debug(msg)
 
 
 def get_arxiv_ids_from_inspire_ids(inspire_ids: List[int]) -> List[str]:
@@ -120,13 +271,16 @@ def get_arxiv_ids_from_inspire_ids(inspire_ids: List[int]) -> List[str]:
         >>> arxiv_ids = get_arxiv_ids_from_inspire_ids(inspire_ids)
         >>> print(arxiv_ids)  # ['1612.08928', '1701.12345', ...]
     """
+    import requests
+
+    session = get_http_session()
     arxiv_ids = []
     
     for inspire_id in inspire_ids:
         try:
             # Fetch the INSPIRE-HEP record data
             url = f"https://inspirehep.net/api/literature/{inspire_id}"
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
             response.raise_for_status()
             
             record = response.json()
@@ -167,6 +321,8 @@ def get_citing_articles_from_inspire_id(inspire_id: int, max_results: int = 100)
     Returns:
         List of arXiv IDs of articles that cite the given paper
     """
+    import requests
+
     arxiv_ids = []
     
     try:
@@ -179,7 +335,7 @@ def get_citing_articles_from_inspire_id(inspire_id: int, max_results: int = 100)
             "fields": "arxiv_eprints"  # Only get arXiv eprints field
         }
         
-        response = requests.get(base_url, params=params, timeout=15)
+        response = get_http_session().get(base_url, params=params, timeout=15)
         response.raise_for_status()
         
         data = response.json()
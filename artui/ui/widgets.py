@@ -7,8 +7,46 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 
+def _truncate(text: str, width: int) -> str:
+    """Shorten ``text`` to ``width`` characters, ending with an ellipsis if cut."""
+    if len(text) > width:
+        return text[:width - 3] + "..."
+    return text
+
+
+def _status_string(is_saved: bool, is_viewed: bool, has_tags: bool, has_note: bool) -> str:
+    """Status column markup for a local database article."""
+    if is_saved:
+        status = "[red]s[/red]"
+    elif is_viewed:
+        status = " "
+    else:
+        status = "●"
+    if has_tags:
+        status += "[blue]t[/blue]"
+    if has_note:
+        status += "[green]n[/green]"
+    return status
+
+
+# Every status column value, indexed by is_saved, is_viewed, has_tags, has_note as bits 3..0
+_STATUS_STRINGS = tuple(
+    _status_string(bool(index & 8), bool(index & 4), bool(index & 2), bool(index & 1))
+    for index in range(16)
+)
+# Global search results only show whether they are saved
+_GLOBAL_STATUS_STRINGS = (" ", " [red]s[/red]")
+
+
 class ArticleTableWidget(DataTable):
-    """Enhanced DataTable widget for displaying articles with sorting functionality."""
+    """Enhanced DataTable widget for displaying articles with sorting functionality.
+
+    Rows are added in pages of PAGE_SIZE; the next page is appended when the
+    cursor or the scroll position gets close to the last rendered row.
+    """
+
+    PAGE_SIZE = 100
+    LOAD_MORE_MARGIN = 10  # Rows from the end at which the next page is appended
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -18,6 +56,7 @@ class ArticleTableWidget(DataTable):
         self.current_is_global_search = False  # Track search type
         self.sort_column = None  # Track current sort column
         self.sort_reverse = False  # Track sort direction
+        self.rendered_count = 0  # Number of articles_data entries added as rows
     
     def setup_columns(self) -> None:
         """Setup table columns."""
@@ -27,83 +66,84 @@ class ArticleTableWidget(DataTable):
         self.add_column("Published")
         self.add_column("Categories", width=20)
     
+    def clear(self, columns: bool = False) -> "ArticleTableWidget":
+        """Clear the table along with the articles backing its rows."""
+        self.articles_data = []
+        self.rendered_count = 0
+        return super().clear(columns)
+    
     def populate_articles(self, articles: List[Any], is_global_search: bool = False) -> None:
         """Populate table with articles and store data for sorting."""
-        self.clear()
-        self.articles_data = articles.copy()  # Store original data
         self.current_is_global_search = is_global_search
         
         # Reset sort state when new data is loaded
         self.sort_column = None
         self.sort_reverse = False
         
-        self._populate_table_rows(articles, is_global_search)
+        self._populate_table_rows(articles.copy(), is_global_search)  # Store original data
     
     def _populate_table_rows(self, articles: List[Any], is_global_search: bool = False) -> None:
         """Internal method to populate table rows from article data."""
         self.clear()
-        
-        for article in articles:
-            authors = ", ".join(author.name for author in article.authors)
-            title = article.title
-            
-            if len(title) > 60:
-                title = title[:57] + "..."
-            
-            if len(authors) > 18:
-                authors = authors[:15] + "..."
-            
-            # Format categories
-            categories = ", ".join(article.categories)
-            if len(categories) > 20:
-                categories = categories[:17] + "..."
-            
-            # Build status string with multiple indicators
-            status = self._build_status_string(article, is_global_search)
-            
-            self.add_row(
-                status, title, authors, 
-                article.published.strftime("%Y-%m-%d"), 
-                categories
-            )
+        self.articles_data = articles
+        self._append_rows(self.PAGE_SIZE, is_global_search)
+    
+    def _append_rows(self, count: int, is_global_search: bool) -> None:
+        """Add rows for the next ``count`` not yet rendered articles."""
+        start = self.rendered_count
+        page = self.articles_data[start:start + count]
+        
+        # Build each column in one pass, then hand the rows to the table together
+        statuses = [self._build_status_string(article, is_global_search) for article in page]
+        titles = [_truncate(article.title, 60) for article in page]
+        authors = [_truncate(article.authors_str, 18) for article in page]
+        published = [article.published_day for article in page]
+        categories = [_truncate(article.categories_str, 20) for article in page]
+        
+        self.add_rows(zip(statuses, titles, authors, published, categories))
+        self.rendered_count += len(page)
+    
+    def load_more_rows(self) -> None:
+        """Append the next page of articles, if any are left."""
+        if self.rendered_count < len(self.articles_data):
+            self._append_rows(self.PAGE_SIZE, self.current_is_global_search)
+    
+    def ensure_row_rendered(self, row_index: int) -> None:
+        """Render pages until ``row_index`` has a table row."""
+        while self.rendered_count <= row_index < len(self.articles_data):
+            self.load_more_rows()
+    
+    def watch_cursor_coordinate(self, old_coordinate: Coordinate, new_coordinate: Coordinate) -> None:
+        super().watch_cursor_coordinate(old_coordinate, new_coordinate)
+        # add_row() re-assigns the unchanged cursor, so only react to real moves
+        if old_coordinate == new_coordinate:
+            return
+        if new_coordinate.row >= self.rendered_count - self.LOAD_MORE_MARGIN:
+            self.load_more_rows()
+    
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if new_value >= self.max_scroll_y - self.LOAD_MORE_MARGIN:
+            self.load_more_rows()
     
     def _build_status_string(self, article: Any, is_global_search: bool) -> str:
         """Build status string for article row."""
-        status_parts = []
-        
-        # For global search results, show nothing instead of read/unread status
+        # For global search results, show nothing instead of read/unread status;
+        # however still show saved status in case of global search
         if is_global_search:
-            status_parts.append(" ")
-            # however still show saved status in case of global search
-            if hasattr(article, 'is_saved') and article.is_saved:
-                status_parts.append("[red]s[/red]")
-        else:
-            # Use database status information
-            if hasattr(article, 'is_saved') and article.is_saved:
-                status_parts.append("[red]s[/red]")
-            elif hasattr(article, 'is_viewed') and article.is_viewed:
-                status_parts.append(" ")
-            else:
-                status_parts.append("●")
-        
-
-        
-        # Add tag indicator (only for local database results)
-        if not is_global_search and hasattr(article, 'has_tags') and article.has_tags:
-            status_parts.append("[blue]t[/blue]")
-        
-        # Add note indicator (only for local database results)
-        if not is_global_search and hasattr(article, 'has_note') and article.has_note:
-            status_parts.append("[green]n[/green]")
-        
-        # Join status parts or use first one if only one
-        if len(status_parts) > 1:
-            return "".join(status_parts)
-        else:
-            return status_parts[0] if status_parts else " "
+            return _GLOBAL_STATUS_STRINGS[1 if article.is_saved else 0]
+        return _STATUS_STRINGS[
+            (8 if article.is_saved else 0)
+            | (4 if article.is_viewed else 0)
+            | (2 if article.has_tags else 0)
+            | (1 if article.has_note else 0)
+        ]
     
     def update_row_status(self, row_index: int, article: Any, is_global_search: bool = False) -> None:
         """Update the status column for a specific table row."""
+        # Rows that are not rendered yet pick up the new status when they are added
+        if row_index >= self.rendered_count:
+            return
         status = self._build_status_string(article, is_global_search)
         self.update_cell_at(Coordinate(row_index, 0), status)
     
@@ -133,18 +173,16 @@ class ArticleTableWidget(DataTable):
             current_article = self.articles_data[current_cursor_row]
             current_article_id = getattr(current_article, 'id', None)
         
-        # Repopulate the table with sorted data
+        # Repopulate the table with sorted data; this also stores the new order
         self._populate_table_rows(sorted_articles, self.current_is_global_search)
         
         # Try to maintain cursor position on the same article
         if current_article_id:
             for i, article in enumerate(sorted_articles):
                 if getattr(article, 'id', None) == current_article_id:
+                    self.ensure_row_rendered(i)
                     self.move_cursor(row=i)
                     break
-        
-        # Update the stored articles data to reflect new order
-        self.articles_data = sorted_articles
     
     def _sort_articles(self, articles: List[Any], column_index: int, reverse: bool = False) -> List[Any]:
         """Sort articles by the specified column."""
@@ -153,13 +191,11 @@ class ArticleTableWidget(DataTable):
                 if column_index == 1:  # Title
                     return article.title.lower()
                 elif column_index == 2:  # Authors
-                    authors = ", ".join(author.name for author in article.authors)
-                    return authors.lower()
+                    return article.authors_str.lower()
                 elif column_index == 3:  # Published date
                     return article.published
                 elif column_index == 4:  # Categories
-                    categories = ", ".join(article.categories)
-                    return categories.lower()
+                    return article.categories_str.lower()
                 else:
                     return ""
             except (AttributeError, TypeError):
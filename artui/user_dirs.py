@@ -1,11 +1,16 @@
 """User directory management for ArTui."""
 
 import os
+import re
 from pathlib import Path
 from typing import Optional
 import shutil
 
 
+# Characters dropped from notes file names: anything but letters, digits, ' ', '.', '-' and '_'
+_UNSAFE_NOTES_FILENAME_RE = re.compile(r'[^\w .-]+')
+
+
 class UserDirectoryManager:
     """Manages user data directories and file paths for ArTui."""
     
@@ -15,6 +20,7 @@ class UserDirectoryManager:
     DATABASE_FILE_NAME = "arxiv_articles.db"
     ARTICLES_DIR_NAME = "articles"
     NOTES_DIR_NAME = "notes"
+    CACHE_DIR_NAME = "cache"
     
     def __init__(self, custom_base_dir: Optional[str] = None):
         """Initialize user directory manager.
@@ -47,6 +53,7 @@ class UserDirectoryManager:
         os.makedirs(self._base_dir, exist_ok=True)
         os.makedirs(self.articles_dir, exist_ok=True)
         os.makedirs(self.notes_dir, exist_ok=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
     
     @property
     def base_dir(self) -> str:
@@ -73,6 +80,11 @@ class UserDirectoryManager:
         """Get the path to the notes directory."""
         return os.path.join(self._base_dir, self.NOTES_DIR_NAME)
     
+    @property
+    def cache_dir(self) -> str:
+        """Get the path to the cache directory (safe to delete at any time)."""
+        return os.path.join(self._base_dir, self.CACHE_DIR_NAME)
+    
     def get_notes_file_path(self, article_id: str, article_title: str) -> str:
         """Get a notes file path for an article.
         
@@ -84,7 +96,7 @@ class UserDirectoryManager:
             Full path to the notes file
         """
         # Sanitize title for filename
-        safe_title = "".join(c for c in article_title if c.isalnum() or c in ' ._-').rstrip()
+        safe_title = _UNSAFE_NOTES_FILENAME_RE.sub('', article_title).rstrip()
         filename = f"{article_id}_{safe_title[:30]}.md"
         return os.path.join(self.notes_dir, filename)
     
@@ -209,6 +221,7 @@ class UserDirectoryManager:
             "database_file": self.database_file,
             "articles_dir": self.articles_dir,
             "notes_dir": self.notes_dir,
+            "cache_dir": self.cache_dir,
             "config_exists": os.path.exists(self.config_file),
             "database_exists": os.path.exists(self.database_file),
             "articles_count": len([f for f in os.listdir(self.articles_dir) 